@@ -6,6 +6,8 @@ Translates Chinese comments and strings to English
 
 import re
 import os
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Translation dictionary - maps Chinese phrases to English
@@ -155,25 +157,49 @@ TRANSLATIONS = {
     "配置文件加载成功": "Configuration file loaded successfully",
 }
 
+# Single-pass matcher: alternatives are tried longest-first at each position,
+# so overlapping phrases resolve leftmost-longest in one scan of the text
+_SINGLE = {k: v for k, v in TRANSLATIONS.items() if len(k) == 1}
+_MULTI = {k: v for k, v in TRANSLATIONS.items() if len(k) > 1}
+_KEYS_SORTED = sorted(_MULTI, key=len, reverse=True)
+_PATTERN = re.compile("|".join(map(re.escape, _KEYS_SORTED)))
+_LOOKUP = _MULTI.__getitem__
+# Single-character entries go through a C-level codepoint table afterwards,
+# so they never split a longer phrase that contains them
+_TRANS_TABLE = str.maketrans(_SINGLE)
+
+def _substitute(match, _lookup=_LOOKUP):
+    """Regex callback with the lookup pre-bound as a local"""
+    return _lookup(match[0])
+
+# Every phrase contains a CJK ideograph, so files without one can be skipped.
+# U+3400-U+9FFF always encodes with a UTF-8 lead byte in 0xE3-0xE9, which
+# lets the check run on the raw bytes before anything is decoded
+_CJK_LEAD_RE = re.compile(rb'[\xe3-\xe9]')
+
 def translate_text(text):
     """Replace Chinese text with English translations"""
-    result = text
-    for chinese, english in sorted(TRANSLATIONS.items(), key=lambda x: -len(x[0])):
-        result = result.replace(chinese, english)
-    return result
+    return _PATTERN.sub(_substitute, text).translate(_TRANS_TABLE)
 
 def process_file(filepath):
     """Process a single file and translate Chinese to English"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(filepath, 'rb') as f:
+            # mmap refuses zero-length files, and they have nothing to translate anyway
+            if os.fstat(f.fileno()).st_size == 0:
+                print(f"- No CJK: {filepath}")
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if not _CJK_LEAD_RE.search(mm):
+                    print(f"- No CJK: {filepath}")
+                    return False
+                original = mm[:].decode('utf-8')
         
-        original = content
-        content = translate_text(content)
+        content = translate_text(original)
         
         if content != original:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            with open(filepath, 'wb') as f:
+                f.write(content.encode('utf-8'))
             print(f"✓ Translated: {filepath}")
             return True
         else:
@@ -183,21 +209,29 @@ def process_file(filepath):
         print(f"✗ Error processing {filepath}: {e}")
         return False
 
+def _iter_py_files(root):
+    """Yield paths of .py files under root as plain strings"""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_py_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
+
 def main():
     """Main function to process all Python files"""
     project_root = Path("/home/engine/project")
     mcp_server = project_root / "mcp_server"
     
-    files_to_process = []
-    for pattern in ["**/*.py"]:
-        files_to_process.extend(mcp_server.glob(pattern))
+    files_to_process = list(_iter_py_files(str(mcp_server)))
     
     print(f"Found {len(files_to_process)} Python files to process\n")
     
-    translated_count = 0
-    for filepath in sorted(files_to_process):
-        if process_file(filepath):
-            translated_count += 1
+    # Files are independent and translation is CPU-bound; each worker
+    # compiles _PATTERN once on import
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_file, sorted(files_to_process), chunksize=8))
+    translated_count = sum(results)
     
     print(f"\n{'='*60}")
     print(f"Translation complete!")
@@ -6,7 +6,7 @@ Translates Chinese to English in Python files, comments, docstrings, and user me
 
 import os
 import re
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # Comprehensive translation dictionary
 TRANSLATIONS = {
@@ -155,67 +155,90 @@ TRANSLATIONS = {
     "已跳过": "skipped",
 }
 
-def translate_line(line):
-    """Translate a single line"""
-    result = line
-    for chinese, english in TRANSLATIONS.items():
-        if chinese in result:
-            result = result.replace(chinese, english)
-    return result
+# Compiled once at import; longest phrases first so "配置文件" wins over "文件"
+_SINGLE = {k: v for k, v in TRANSLATIONS.items() if len(k) == 1}
+_MULTI = {k: v for k, v in TRANSLATIONS.items() if len(k) > 1}
+_KEYS_SORTED = sorted(_MULTI, key=len, reverse=True)
+_PATTERN = re.compile("|".join(map(re.escape, _KEYS_SORTED)))
+_LOOKUP = _MULTI.__getitem__
+# Single-character entries go through a C-level codepoint table afterwards,
+# so they never split a longer phrase that contains them
+_TRANS_TABLE = str.maketrans(_SINGLE)
+
+def _substitute(match, _lookup=_LOOKUP):
+    """Regex callback with the lookup pre-bound as a local"""
+    return _lookup(match[0])
+
+# Every phrase that changes text contains a CJK ideograph
+_CJK_RE = re.compile(r'[\u3400-\u9fff]')
+
+def translate_text(text):
+    """Translate a block of text"""
+    return _PATTERN.sub(_substitute, text).translate(_TRANS_TABLE)
 
 def translate_file(filepath):
     """Translate a single file"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            content = f.read()
         
-        # Process line by line
-        translated_lines = []
-        changed = False
-        for line in lines:
-            translated = translate_line(line)
-            translated_lines.append(translated)
-            if translated != line:
-                changed = True
+        if not _CJK_RE.search(content):
+            return False
         
-        if changed:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.writelines(translated_lines)
+        # Whole-file pass; no phrase spans a newline so this matches per-line output
+        translated = translate_text(content)
+        
+        if translated != content:
+            with open(filepath, 'wb') as f:
+                f.write(translated.encode('utf-8'))
             return True
         return False
     except Exception as e:
         print(f"Error processing {filepath}: {e}")
         return False
 
+def _iter_py_files(root):
+    """Yield paths of .py files under root as plain strings"""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_py_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
+
 def main():
     """Main function"""
-    project_root = Path("/home/engine/project")
+    project_root = "/home/engine/project"
     
     # Files to translate
     files_to_process = []
     
     # Python files in mcp_server
-    files_to_process.extend(list((project_root / "mcp_server").rglob("*.py")))
+    files_to_process.extend(_iter_py_files(os.path.join(project_root, "mcp_server")))
     
     # Main.py
-    main_py = project_root / "main.py"
-    if main_py.exists():
+    main_py = os.path.join(project_root, "main.py")
+    if os.path.exists(main_py):
         files_to_process.append(main_py)
     
     # Docker management script
-    docker_manage = project_root / "docker" / "manage.py"
-    if docker_manage.exists():
+    docker_manage = os.path.join(project_root, "docker", "manage.py")
+    if os.path.exists(docker_manage):
         files_to_process.append(docker_manage)
     
     print(f"Processing {len(files_to_process)} Python files...")
     
+    # Files are independent and translation is CPU-bound; map keeps input order
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(translate_file, files_to_process, chunksize=8))
+    
     translated = 0
-    for filepath in files_to_process:
-        if translate_file(filepath):
-            print(f"✓ {filepath.relative_to(project_root)}")
+    for filepath, changed in zip(files_to_process, results):
+        if changed:
+            print(f"✓ {os.path.relpath(filepath, project_root)}")
             translated += 1
         else:
-            print(f"- {filepath.relative_to(project_root)}")
+            print(f"- {os.path.relpath(filepath, project_root)}")
     
     print(f"\nTranslated {translated}/{len(files_to_process)} files")
 
@@ -4,10 +4,13 @@
 news爬虫容器管理工具 - supercronic
 """
 
+import functools
+import heapq
 import os
 import sys
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -22,6 +25,63 @@ def run_command(cmd, shell=True, capture_output=True):
         return False, "", str(e)
 
 
+def run_command_quiet(cmd, shell=True):
+    """Execute系统命令，丢弃output，只return是否successfully"""
+    try:
+        result = subprocess.run(
+            cmd, shell=shell, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def _read_proc(path):
+    """用 os.read 直接读取 /proc 小file，绕过 Python 文本 IO 栈"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8", "replace")
+
+
+@functools.lru_cache(maxsize=1)
+def _pid1_cmdline():
+    """读取 PID 1 的命令行（进程内缓存）"""
+    return _read_proc('/proc/1/cmdline').replace('\x00', ' ').strip()
+
+
+@functools.lru_cache(maxsize=None)
+def _env(name):
+    """读取环境变量，未设置时return "未设置"（进程内缓存）"""
+    return os.environ.get(name, "未设置")
+
+
+def _existing_paths(paths):
+    """按父directory分组，每个directory只 scandir 一次，return存在的path集合"""
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+
+    def scan(item):
+        dirname, names = item
+        try:
+            with os.scandir(dirname) as it:
+                return [os.path.join(dirname, e.name) for e in it if e.name in names]
+        except OSError:
+            return []
+
+    # 各directory互不依赖，并发 scandir 以重叠慢速 overlayfs 上的阻塞 IO
+    with ThreadPoolExecutor(max_workers=min(8, len(by_dir) or 1)) as executor:
+        return {path for found in executor.map(scan, by_dir.items()) for path in found}
+
+
 def manual_run():
     """手动Execute一次爬虫"""
     print("🔄 手动Execute爬虫...")
@@ -37,6 +97,15 @@ def manual_run():
         print(f"❌ Execute出错: {e}")
 
 
+_WEEKDAY_NAMES = {
+    "0": "周日", "1": "周一", "2": "周二", "3": "周三",
+    "4": "周四", "5": "周五", "6": "周六", "7": "周日"
+}
+
+# 组合复杂描述时省略的无信息片段
+_CRON_DESC_SKIP = frozenset({"", "每月", "每天", "每hour"})
+
+
 def parse_cron_schedule(cron_expr):
     """Parsecron表达式并return人类可读的描述"""
     if not cron_expr or cron_expr == "未设置":
@@ -49,6 +118,14 @@ def parse_cron_schedule(cron_expr):
         
         minute, hour, day, month, weekday = parts
         
+        # 常见简单模式先判断，无需构建各字段描述
+        if hour == "*" == day == month == weekday and minute.startswith("*/"):
+            # 简单的间隔模式，如 */30 * * * *
+            return f"每{minute[2:]}minuteExecute一次"
+        if day == "*" == month == weekday and hour != "*" and minute != "*":
+            # 每天特定time，如 0 9 * * *
+            return f"每天{hour}:{minute.zfill(2)}Execute"
+        
         # analysisminute
         if minute == "*":
             minute_desc = "每minute"
@@ -87,28 +164,18 @@ def parse_cron_schedule(cron_expr):
             month_desc = f"在{month}月"
         
         # analysis星期
-        weekday_names = {
-            "0": "周日", "1": "周一", "2": "周二", "3": "周三", 
-            "4": "周四", "5": "周五", "6": "周六", "7": "周日"
-        }
         if weekday == "*":
             weekday_desc = ""
         else:
-            weekday_desc = f"在{weekday_names.get(weekday, weekday)}"
+            weekday_desc = f"在{_WEEKDAY_NAMES.get(weekday, weekday)}"
         
         # 组合描述
-        if minute.startswith("*/") and hour == "*" and day == "*" and month == "*" and weekday == "*":
-            # 简单的间隔模式，如 */30 * * * *
-            return f"每{minute[2:]}minuteExecute一次"
-        elif hour != "*" and minute != "*" and day == "*" and month == "*" and weekday == "*":
-            # 每天特定time，如 0 9 * * *
-            return f"每天{hour}:{minute.zfill(2)}Execute"
-        elif weekday != "*" and day == "*":
+        if weekday != "*" and day == "*":
             # 每周特定time
             return f"{weekday_desc}{hour}:{minute.zfill(2)}Execute"
         else:
             # 复杂模式，显示详细information
-            desc_parts = [part for part in [month_desc, day_desc, weekday_desc, hour_desc, minute_desc] if part and part != "每月" and part != "每天" and part != "每hour"]
+            desc_parts = [part for part in (month_desc, day_desc, weekday_desc, hour_desc, minute_desc) if part not in _CRON_DESC_SKIP]
             if desc_parts:
                 return " ".join(desc_parts) + "Execute"
             else:
@@ -126,8 +193,7 @@ def show_status():
     supercronic_is_pid1 = False
     pid1_cmdline = ""
     try:
-        with open('/proc/1/cmdline', 'r') as f:
-            pid1_cmdline = f.read().replace('\x00', ' ').strip()
+        pid1_cmdline = _pid1_cmdline()
         print(f"  🔍 PID 1 进程: {pid1_cmdline}")
         
         if "supercronic" in pid1_cmdline.lower():
@@ -140,9 +206,9 @@ def show_status():
         print(f"  ❌ 无法读取 PID 1 information: {e}")
 
     # Check环境变量
-    cron_schedule = os.environ.get("CRON_SCHEDULE", "未设置")
-    run_mode = os.environ.get("RUN_MODE", "未设置")
-    immediate_run = os.environ.get("IMMEDIATE_RUN", "未设置")
+    cron_schedule = _env("CRON_SCHEDULE")
+    run_mode = _env("RUN_MODE")
+    immediate_run = _env("IMMEDIATE_RUN")
     
     print(f"  ⚙️ 运行配置:")
     print(f"    CRON_SCHEDULE: {cron_schedule}")
@@ -154,26 +220,26 @@ def show_status():
     print(f"    RUN_MODE: {run_mode}")
     print(f"    IMMEDIATE_RUN: {immediate_run}")
 
-    # Checkconfiguration file
+    # Checkconfiguration file和关键file（一次性并发Check所有path）
     config_files = ["/app/config/config.yaml", "/app/config/frequency_words.txt"]
-    print("  📁 configuration file:")
-    for file_path in config_files:
-        if Path(file_path).exists():
-            print(f"    ✅ {Path(file_path).name}")
-        else:
-            print(f"    ❌ {Path(file_path).name} 缺失")
-
-    # Check关键file
     key_files = [
         ("/usr/local/bin/supercronic-linux-amd64", "supercronic二进制file"),
         ("/usr/local/bin/supercronic", "supercronic软link"),
         ("/tmp/crontab", "crontabfile"),
         ("/entrypoint.sh", "Start脚本")
     ]
-    
+    present_paths = _existing_paths(config_files + [file_path for file_path, _ in key_files])
+
+    print("  📁 configuration file:")
+    for file_path in config_files:
+        if file_path in present_paths:
+            print(f"    ✅ {Path(file_path).name}")
+        else:
+            print(f"    ❌ {Path(file_path).name} 缺失")
+
     print("  📂 关键fileCheck:")
     for file_path, description in key_files:
-        if Path(file_path).exists():
+        if file_path in present_paths:
             print(f"    ✅ {description}: 存在")
             # 对于crontabfile，显示content
             if file_path == "/tmp/crontab":
@@ -190,39 +256,40 @@ def show_status():
     print("  ⏱️ 容器timeinformation:")
     try:
         # Check PID 1 的Starttime
-        with open('/proc/1/stat', 'r') as f:
-            stat_content = f.read().strip().split()
-            if len(stat_content) >= 22:
-                # starttime 是第22个字段（索引21）
-                starttime_ticks = int(stat_content[21])
-                
-                # 读取系统Starttime
-                with open('/proc/stat', 'r') as stat_f:
-                    for line in stat_f:
-                        if line.startswith('btime'):
-                            boot_time = int(line.split()[1])
-                            break
-                    else:
-                        boot_time = 0
-                
-                # 读取系统时钟频率
-                clock_ticks = os.sysconf(os.sysconf_names['SC_CLK_TCK'])
+        stat_data = _read_proc('/proc/1/stat')
+        # comm 字段（第2个）可能包含空格，从最后一个 ")" 之后再切分，
+        # 剩余部分从第3个字段开始
+        stat_fields = stat_data[stat_data.rindex(')') + 2:].split()
+        if len(stat_fields) >= 20:
+            # starttime 是第22个字段（剩余部分索引19）
+            starttime_ticks = int(stat_fields[19])
+            
+            # 读取系统Starttime
+            for line in _read_proc('/proc/stat').splitlines():
+                if line.startswith('btime'):
+                    boot_time = int(line.split()[1])
+                    break
+            else:
+                boot_time = 0
+            
+            # 读取系统时钟频率
+            clock_ticks = os.sysconf(os.sysconf_names['SC_CLK_TCK'])
+            
+            if boot_time > 0:
+                pid1_start_time = boot_time + (starttime_ticks / clock_ticks)
+                current_time = time.time()
+                uptime_seconds = int(current_time - pid1_start_time)
+                uptime_minutes = uptime_seconds // 60
+                uptime_hours = uptime_minutes // 60
                 
-                if boot_time > 0:
-                    pid1_start_time = boot_time + (starttime_ticks / clock_ticks)
-                    current_time = time.time()
-                    uptime_seconds = int(current_time - pid1_start_time)
-                    uptime_minutes = uptime_seconds // 60
-                    uptime_hours = uptime_minutes // 60
-                    
-                    if uptime_hours > 0:
-                        print(f"    PID 1 运行time: {uptime_hours} hour {uptime_minutes % 60} minute")
-                    else:
-                        print(f"    PID 1 运行time: {uptime_minutes} minute ({uptime_seconds} second)")
+                if uptime_hours > 0:
+                    print(f"    PID 1 运行time: {uptime_hours} hour {uptime_minutes % 60} minute")
                 else:
-                    print(f"    PID 1 运行time: 无法精确计算")
+                    print(f"    PID 1 运行time: {uptime_minutes} minute ({uptime_seconds} second)")
             else:
-                print("    ❌ 无法Parse PID 1 statisticsinformation")
+                print(f"    PID 1 运行time: 无法精确计算")
+        else:
+            print("    ❌ 无法Parse PID 1 statisticsinformation")
     except Exception as e:
         print(f"    ❌ timeCheckfailed: {e}")
 
@@ -264,6 +331,14 @@ def show_status():
     print("    • 重启容器服务: docker restart trend-radar")
 
 
+_SENSITIVE_MARKERS = ("WEBHOOK", "TOKEN", "KEY")
+
+
+def _is_sensitive(var):
+    """环境变量名是否包含敏感标记"""
+    return any(marker in var for marker in _SENSITIVE_MARKERS)
+
+
 def show_config():
     """显示current配置"""
     print("⚙️ current配置:")
@@ -282,11 +357,11 @@ def show_config():
     ]
 
     for var in env_vars:
-        value = os.environ.get(var, "未设置")
+        value = _env(var)
         # 隐藏敏感information
-        if any(sensitive in var for sensitive in ["WEBHOOK", "TOKEN", "KEY"]):
+        if _is_sensitive(var):
             if value and value != "未设置":
-                masked_value = value[:10] + "***" if len(value) > 10 else "***"
+                masked_value = f"{value[:10]}***" if len(value) > 10 else "***"
                 print(f"  {var}: {masked_value}")
             else:
                 print(f"  {var}: {value}")
@@ -315,30 +390,34 @@ def show_files():
         print("  📭 outputdirectorydoes not exist")
         return
 
-    # 显示最近的file
-    date_dirs = sorted([d for d in output_dir.iterdir() if d.is_dir()], reverse=True)
+    # 显示最近2天的file（只取前2个，不必全量排序）
+    with os.scandir(output_dir) as it:
+        date_dirs = heapq.nlargest(
+            2, (entry for entry in it if entry.is_dir()), key=lambda e: e.name
+        )
 
     if not date_dirs:
         print("  📭 outputdirectory为空")
         return
 
-    # 显示最近2天的file
-    for date_dir in date_dirs[:2]:
+    for date_dir in date_dirs:
         print(f"  📅 {date_dir.name}:")
         for subdir in ["html", "txt"]:
-            sub_path = date_dir / subdir
-            if sub_path.exists():
-                files = list(sub_path.glob("*"))
+            sub_path = os.path.join(date_dir.path, subdir)
+            if os.path.isdir(sub_path):
+                # 每个file只 stat 一次，mtime 与 size 复用同一结果
+                with os.scandir(sub_path) as it:
+                    files = [(entry.name, entry.stat()) for entry in it]
                 if files:
-                    recent_files = sorted(
-                        files, key=lambda x: x.stat().st_mtime, reverse=True
-                    )[:3]
+                    recent_files = heapq.nlargest(
+                        3, files, key=lambda item: item[1].st_mtime
+                    )
                     print(f"    📂 {subdir}: {len(files)} 个file")
-                    for file in recent_files:
-                        mtime = time.ctime(file.stat().st_mtime)
-                        size_kb = file.stat().st_size // 1024
+                    for name, st in recent_files:
+                        mtime = time.ctime(st.st_mtime)
+                        size_kb = st.st_size // 1024
                         print(
-                            f"      📄 {file.name} ({size_kb}KB, {mtime.split()[3][:5]})"
+                            f"      📄 {name} ({size_kb}KB, {mtime.split()[3][:5]})"
                         )
                 else:
                     print(f"    📂 {subdir}: 空")
@@ -377,8 +456,7 @@ def restart_supercronic():
     
     # Checkcurrent PID 1
     try:
-        with open('/proc/1/cmdline', 'r') as f:
-            pid1_cmdline = f.read().replace('\x00', ' ').strip()
+        pid1_cmdline = _pid1_cmdline()
         print(f"  🔍 current PID 1: {pid1_cmdline}")
         
         if "supercronic" in pid1_cmdline.lower():
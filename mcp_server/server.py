@@ -5,11 +5,30 @@ Provides production-grade MCP tool server using FastMCP 2.0.
 Supports both stdio and HTTP transport modes.
 """
 
+import asyncio
+import functools
+import inspect
 import json
-from typing import List, Optional, Dict
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, List, Optional, Dict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 可选加速依赖
+    orjson = None
+
+# orjson 选项掩码只计算一次，避免每次序列化重复做属性查找
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _ORJSON_KEY_OPTS = orjson.OPT_SORT_KEYS
 
 from fastmcp import FastMCP
 
+from .services.cache_service import get_cache
 from .tools.data_query import DataQueryTools
 from .tools.analytics import AnalyticsTools
 from .tools.search_tools import SearchTools
@@ -20,24 +39,152 @@ from .tools.system import SystemManagementTools
 # Create FastMCP 2.0 application
 mcp = FastMCP('trendradar-news')
 
-# Global tool instances (initialized on first request)
-_tools_instances = {}
+# Global tool instances (built once by run_server, or lazily on first request)
+_tools: Optional[SimpleNamespace] = None
+_tools_lock = threading.Lock()
 
 
-def _get_tools(project_root: Optional[str] = None):
-    """Get or create tool instances (singleton pattern)"""
-    if not _tools_instances:
-        _tools_instances['data'] = DataQueryTools(project_root)
-        _tools_instances['analytics'] = AnalyticsTools(project_root)
-        _tools_instances['search'] = SearchTools(project_root)
-        _tools_instances['config'] = ConfigManagementTools(project_root)
-        _tools_instances['system'] = SystemManagementTools(project_root)
-    return _tools_instances
+def _dump(obj) -> str:
+    """
+    将工具result序列化为JSON文本（优先use orjson）
+
+    FastMCP 的工具result以文本内容下发，return bytes 仍会被再解码一次，
+    所以这里保持 str。
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+# 工具实现均为同步代码（fileIO、JSONParse、相似度计算），放到线程池Execute，
+# 避免阻塞事件循环、串行化 HTTP 模式下的并发请求
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="mcp-tool"
+)
+
+
+async def _run_tool(func, **kwargs):
+    """在线程池中Execute同步工具方法"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(func, **kwargs))
+
+
+def _cached_tool(ttl: int, fingerprint: Optional[Callable[[], Any]] = None):
+    """
+    工具响应缓存装饰器：以 (工具名, 规范化参数) 为键缓存序列化后的JSON
+
+    成功与failed（error）响应都会被缓存，命中时跳过工具逻辑和序列化。
+    有副作用的工具（如 trigger_crawl）不应use。
+
+    Args:
+        ttl: 缓存存活time（second）
+        fingerprint: optional，return数据源版本（如file mtime）的函数，
+                     版本变化即自然失效，ttl 只作兜底
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = f"tool:{fn.__name__}:{_canonical_args(bound.arguments)}"
+            if fingerprint is not None:
+                key = f"{key}@{fingerprint()}"
+
+            cache = get_cache()
+            hit = cache.get(key, ttl=ttl)
+            if hit is not None:
+                return hit
+
+            output = await fn(*args, **kwargs)
+            cache.set(key, output)
+            return output
+
+        return wrapper
+    return decorator
+
+
+def _canonical_args(arguments: dict) -> str:
+    """将参数规范化为稳定的字符串（键排序）"""
+    if orjson is not None:
+        return orjson.dumps(arguments, option=_ORJSON_KEY_OPTS).decode()
+    return json.dumps(arguments, sort_keys=True, ensure_ascii=False)
+
+
+def _config_fingerprint() -> str:
+    """configuration file版本指纹：config.yaml 与 frequency_words.txt 的 mtime_ns"""
+    config_dir = _get_tools().config.data_service.parser.project_root / "config"
+    stamps = []
+    for name in ("config.yaml", "frequency_words.txt"):
+        try:
+            stamps.append(str(os.stat(config_dir / name).st_mtime_ns))
+        except OSError:
+            stamps.append("-")
+    return ":".join(stamps)
+
+
+def _get_tools(project_root: Optional[str] = None) -> SimpleNamespace:
+    """Get or create tool instances (singleton pattern, double-checked locking)"""
+    global _tools
+    tools = _tools
+    if tools is None:
+        with _tools_lock:
+            if _tools is None:
+                _tools = SimpleNamespace(
+                    data=DataQueryTools(project_root),
+                    analytics=AnalyticsTools(project_root),
+                    search=SearchTools(project_root),
+                    config=ConfigManagementTools(project_root),
+                    system=SystemManagementTools(project_root),
+                )
+            tools = _tools
+    return tools
+
+
+def _warm_tool_schemas() -> int:
+    """
+    Start前预热所有工具的参数 schema / validator
+
+    FastMCP 在首次调用时才会惰性构建参数 schema 与 pydantic 校验器，
+    这里在主线程一次性触发，避免首个请求承担这部分开销。
+    依赖 FastMCP 内部属性，任何一步失败都只跳过，不影响启动。
+
+    Returns:
+        成功预热的工具数量
+    """
+    manager = getattr(mcp, "_tool_manager", None)
+    registry = getattr(manager, "_tools", None)
+    if not isinstance(registry, dict):
+        return 0
+
+    try:
+        from fastmcp.utilities.types import get_cached_typeadapter
+    except ImportError:
+        get_cached_typeadapter = None
+
+    warmed = 0
+    for tool in registry.values():
+        try:
+            for attr in ("parameters", "input_schema", "schema"):
+                getattr(tool, attr, None)
+            fn = getattr(tool, "fn", None)
+            if fn is not None and get_cached_typeadapter is not None:
+                get_cached_typeadapter(fn)
+            model = getattr(tool, "model", None)
+            if model is not None and hasattr(model, "model_rebuild"):
+                model.model_rebuild()
+            warmed += 1
+        except Exception:
+            continue
+    return warmed
 
 
 # ==================== Data Query Tools ====================
 
 @mcp.tool
+@_cached_tool(ttl=60)
 async def get_latest_news(
     platforms: Optional[List[str]] = None,
     limit: int = 50,
@@ -71,11 +218,12 @@ async def get_latest_news(
     **Note**：如果用户询问"为什么只显示了部分"，说明他们need完整data
     """
     tools = _get_tools()
-    result = tools['data'].get_latest_news(platforms=platforms, limit=limit, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _run_tool(tools.data.get_latest_news, platforms=platforms, limit=limit, include_url=include_url)
+    return _dump(result)
 
 
 @mcp.tool
+@_cached_tool(ttl=60)
 async def get_trending_topics(
     top_n: int = 10,
     mode: str = 'current'
@@ -96,8 +244,8 @@ async def get_trending_topics(
         JSON格式的关注词频率statisticslist
     """
     tools = _get_tools()
-    result = tools['data'].get_trending_topics(top_n=top_n, mode=mode)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _run_tool(tools.data.get_trending_topics, top_n=top_n, mode=mode)
+    return _dump(result)
 
 
 @mcp.tool
@@ -139,13 +287,14 @@ async def get_news_by_date(
     **Note**：如果用户询问"为什么只显示了部分"，说明他们need完整data
     """
     tools = _get_tools()
-    result = tools['data'].get_news_by_date(
+    result = await _run_tool(
+        tools.data.get_news_by_date,
         date_query=date_query,
         platforms=platforms,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 
@@ -197,7 +346,8 @@ async def analyze_topic_trend(
         - analyze_topic_trend(topic="ChatGPT", analysis_type="predict", lookahead_hours=6)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_topic_trend_unified(
+    result = await _run_tool(
+        tools.analytics.analyze_topic_trend_unified,
         topic=topic,
         analysis_type=analysis_type,
         date_range=date_range,
@@ -207,7 +357,7 @@ async def analyze_topic_trend(
         lookahead_hours=lookahead_hours,
         confidence_threshold=confidence_threshold
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 @mcp.tool
@@ -243,14 +393,15 @@ async def analyze_data_insights(
         - analyze_data_insights(insight_type="keyword_cooccur", min_frequency=5, top_n=15)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_data_insights_unified(
+    result = await _run_tool(
+        tools.analytics.analyze_data_insights_unified,
         insight_type=insight_type,
         topic=topic,
         date_range=date_range,
         min_frequency=min_frequency,
         top_n=top_n
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 @mcp.tool
@@ -290,7 +441,8 @@ async def analyze_sentiment(
     - 仅在用户明确要求"总结"或"挑重点"时才进行filter
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_sentiment(
+    result = await _run_tool(
+        tools.analytics.analyze_sentiment,
         topic=topic,
         platforms=platforms,
         date_range=date_range,
@@ -298,7 +450,7 @@ async def analyze_sentiment(
         sort_by_weight=sort_by_weight,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 @mcp.tool
@@ -328,13 +480,14 @@ async def find_similar_news(
     - 仅在用户明确要求"总结"或"挑重点"时才进行filter
     """
     tools = _get_tools()
-    result = tools['analytics'].find_similar_news(
+    result = await _run_tool(
+        tools.analytics.find_similar_news,
         reference_title=reference_title,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 @mcp.tool
@@ -356,11 +509,12 @@ async def generate_summary_report(
         JSON格式的摘要report，includeMarkdown格式content
     """
     tools = _get_tools()
-    result = tools['analytics'].generate_summary_report(
+    result = await _run_tool(
+        tools.analytics.generate_summary_report,
         report_type=report_type,
         date_range=date_range
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 # ==================== 智能检索工具 ====================
@@ -427,7 +581,8 @@ async def search_news(
         - 模糊search: search_news(query="特斯拉降价", search_mode="fuzzy", threshold=0.4)
     """
     tools = _get_tools()
-    result = tools['search'].search_news_unified(
+    result = await _run_tool(
+        tools.search.search_news_unified,
         query=query,
         search_mode=search_mode,
         date_range=date_range,
@@ -437,7 +592,7 @@ async def search_news(
         threshold=threshold,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 @mcp.tool
@@ -474,19 +629,21 @@ async def search_related_news_history(
     - 仅在用户明确要求"总结"或"挑重点"时才进行filter
     """
     tools = _get_tools()
-    result = tools['search'].search_related_news_history(
+    result = await _run_tool(
+        tools.search.search_related_news_history,
         reference_text=reference_text,
         time_preset=time_preset,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return _dump(result)
 
 
 # ==================== 配置与系统管理工具 ====================
 
 @mcp.tool
+@_cached_tool(ttl=3600, fingerprint=_config_fingerprint)
 async def get_current_config(
     section: str = "all"
 ) -> str:
@@ -505,11 +662,12 @@ async def get_current_config(
         JSON格式的配置information
     """
     tools = _get_tools()
-    result = tools['config'].get_current_config(section=section)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _run_tool(tools.config.get_current_config, section=section)
+    return _dump(result)
 
 
 @mcp.tool
+@_cached_tool(ttl=1)
 async def get_system_status() -> str:
     """
     Get系统运行状态和健康Checkinformation
@@ -520,8 +678,8 @@ async def get_system_status() -> str:
         JSON格式的系统状态information
     """
     tools = _get_tools()
-    result = tools['system'].get_system_status()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _run_tool(tools.system.get_system_status, )
+    return _dump(result)
 
 
 @mcp.tool
@@ -555,12 +713,45 @@ async def trigger_crawl(
         - usedefaultPlatform: trigger_crawl()  # 爬取config.yaml中配置的所有Platform
     """
     tools = _get_tools()
-    result = tools['system'].trigger_crawl(platforms=platforms, save_to_local=save_to_local, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    result = await _run_tool(tools.system.trigger_crawl, platforms=platforms, save_to_local=save_to_local, include_url=include_url)
+    return _dump(result)
 
 
 # ==================== Start入口 ====================
 
+_BANNER_TEMPLATE = """
+{rule}
+  TrendRadar MCP Server - FastMCP 2.0
+{rule}
+  传输模式: {transport}
+{transport_info}  项目directory: {project_root}
+
+  已注册的工具:
+    === 基础dataquery（P0核心）===
+    1. get_latest_news        - Getlatestnews
+    2. get_news_by_date       - 按datequerynews（support自然语言）
+    3. get_trending_topics    - Get趋势话题
+
+    === 智能检索工具 ===
+    4. search_news                  - 统一newssearch（关键词/模糊/实体）
+    5. search_related_news_history  - history相关news检索
+
+    === 高级dataanalysis ===
+    6. analyze_topic_trend      - 统一话题趋势analysis（热度/生命周期/爆火/预测）
+    7. analyze_data_insights    - 统一data洞察analysis（Platform对比/活跃度/关键词共现）
+    8. analyze_sentiment        - 情感倾向analysis
+    9. find_similar_news        - 相似news查找
+    10. generate_summary_report - 每日/每周摘要Generate
+
+    === 配置与系统管理 ===
+    11. get_current_config      - Getcurrent系统配置
+    12. get_system_status       - Get系统运行状态
+    13. trigger_crawl           - 手动触发爬取任务
+{rule}
+
+"""
+
+
 def run_server(
     project_root: Optional[str] = None,
     transport: str = 'stdio',
@@ -579,56 +770,50 @@ def run_server(
     # Initialize工具实例
     _get_tools(project_root)
 
-    # 打印Startinformation
-    print()
-    print("=" * 60)
-    print("  TrendRadar MCP Server - FastMCP 2.0")
-    print("=" * 60)
-    print(f"  传输模式: {transport.upper()}")
+    # 预热工具 schema，首个请求不再承担构建开销
+    _warm_tool_schemas()
+
+    # 后台定期清理过期缓存（ttl 取各工具/服务use的最大值 1天）
+    get_cache().start_periodic_cleanup(interval=60, ttl=86400)
+
+    # 后台预热最常用的query（default参数的关注词statistics），之后由 DataService 定期预刷新
+    _EXECUTOR.submit(_get_tools().data.get_trending_topics, top_n=10, mode="current")
 
+    # 打印Startinformation（一次性写出；stdio 模式下 stdout 用于 MCP 协议帧，改写到 stderr）
     if transport == 'stdio':
-        print("  协议: MCP over stdio (标准inputoutput)")
-        print("  说明: 通过标准inputoutput与 MCP 客户端通信")
+        transport_info = (
+            "  协议: MCP over stdio (标准inputoutput)\n"
+            "  说明: 通过标准inputoutput与 MCP 客户端通信\n"
+        )
     elif transport == 'http':
-        print(f"  监听地址: http://{host}:{port}")
-        print(f"  HTTP端点: http://{host}:{port}/mcp")
-        print("  协议: MCP over HTTP (生产环境)")
-
-    if project_root:
-        print(f"  项目directory: {project_root}")
+        transport_info = (
+            f"  监听地址: http://{host}:{port}\n"
+            f"  HTTP端点: http://{host}:{port}/mcp\n"
+            "  协议: MCP over HTTP (生产环境)\n"
+        )
     else:
-        print("  项目directory: currentdirectory")
-
-    print()
-    print("  已注册的工具:")
-    print("    === 基础dataquery（P0核心）===")
-    print("    1. get_latest_news        - Getlatestnews")
-    print("    2. get_news_by_date       - 按datequerynews（support自然语言）")
-    print("    3. get_trending_topics    - Get趋势话题")
-    print()
-    print("    === 智能检索工具 ===")
-    print("    4. search_news                  - 统一newssearch（关键词/模糊/实体）")
-    print("    5. search_related_news_history  - history相关news检索")
-    print()
-    print("    === 高级dataanalysis ===")
-    print("    6. analyze_topic_trend      - 统一话题趋势analysis（热度/生命周期/爆火/预测）")
-    print("    7. analyze_data_insights    - 统一data洞察analysis（Platform对比/活跃度/关键词共现）")
-    print("    8. analyze_sentiment        - 情感倾向analysis")
-    print("    9. find_similar_news        - 相似news查找")
-    print("    10. generate_summary_report - 每日/每周摘要Generate")
-    print()
-    print("    === 配置与系统管理 ===")
-    print("    11. get_current_config      - Getcurrent系统配置")
-    print("    12. get_system_status       - Get系统运行状态")
-    print("    13. trigger_crawl           - 手动触发爬取任务")
-    print("=" * 60)
-    print()
+        transport_info = ""
+
+    stream = sys.stderr if transport == 'stdio' else sys.stdout
+    stream.write(_BANNER_TEMPLATE.format(
+        rule="=" * 60,
+        transport=transport.upper(),
+        transport_info=transport_info,
+        project_root=project_root or "currentdirectory",
+    ))
+    stream.flush()
 
     # 根据传输模式运行服务器
     if transport == 'stdio':
         mcp.run(transport='stdio')
     elif transport == 'http':
-        # HTTP 模式（生产推荐）
+        # HTTP 模式（生产推荐）：长驻进程，有 uvloop 时换用 libuv 事件循环降低调度开销；
+        # stdio 模式进程短命，import 开销大于收益，不启用
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
         mcp.run(
             transport='http',
             host=host,
@@ -639,8 +824,8 @@ def run_server(
         raise ValueError(f"不support的传输模式: {transport}")
 
 
-if __name__ == '__main__':
-    import sys
+def _build_arg_parser():
+    """完整的 argparse parser，只在 --help 或参数有误时构建"""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -685,12 +870,54 @@ Cherry Studio 配置示例:
         '--project-root',
         help='项目根directorypath'
     )
+    return parser
 
-    args = parser.parse_args()
+
+_CLI_OPTIONS = {
+    '--transport': 'transport',
+    '--host': 'host',
+    '--port': 'port',
+    '--project-root': 'project_root',
+}
+
+
+def _parse_args(argv: List[str]) -> Dict[str, Any]:
+    """
+    手写的轻量命令行解析（stdio 模式每次会话都会Start进程，省去 argparse 的开销）
+
+    只处理 --opt value / --opt=value 两种常规形式；遇到 --help、未知参数
+    或非法值时交给 argparse，保持原有的help与error信息。
+    """
+    options: Dict[str, Any] = {
+        'transport': 'stdio',
+        'host': '0.0.0.0',
+        'port': 3333,
+        'project_root': None,
+    }
+    i = 0
+    try:
+        while i < len(argv):
+            flag, sep, value = argv[i].partition('=')
+            dest = _CLI_OPTIONS[flag]
+            if not sep:
+                i += 1
+                value = argv[i]
+            options[dest] = value
+            i += 1
+        options['port'] = int(options['port'])
+        if options['transport'] not in ('stdio', 'http'):
+            raise ValueError(options['transport'])
+    except (KeyError, IndexError, ValueError):
+        return vars(_build_arg_parser().parse_args(argv))
+    return options
+
+
+if __name__ == '__main__':
+    args = _parse_args(sys.argv[1:])
 
     run_server(
-        project_root=args.project_root,
-        transport=args.transport,
-        host=args.host,
-        port=args.port
+        project_root=args['project_root'],
+        transport=args['transport'],
+        host=args['host'],
+        port=args['port']
     )
@@ -4,76 +4,120 @@
 实现TTL缓存机制，提升data访问性能。
 """
 
+import os
+import threading
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
 from threading import Lock
 
+_NS_PER_SECOND = 1_000_000_000
+
+_Shard = Tuple["OrderedDict[Hashable, Tuple[int, Any]]", "OrderedDict[Hashable, int]", Lock]
+
+
+def _default_shard_count() -> int:
+    """分片数取 CPU 核数向上取整到 2 的幂"""
+    cpus = os.cpu_count() or 1
+    return 1 << (cpus - 1).bit_length()
+
 
 class CacheService:
-    """缓存服务类"""
+    """缓存服务类（分片的、带容量上限的 LRU + TTL 缓存）"""
 
-    def __init__(self):
-        """Initialize缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
-        self._lock = Lock()
+    __slots__ = ("_shards", "_mask", "_max")
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+    def __init__(self, maxsize: int = 1024, shards: Optional[int] = None):
+        """
+        Initialize缓存服务
+
+        Args:
+            maxsize: 最大缓存条目数，exceed时淘汰最久未use的条目
+            shards: 分片数（2 的幂），default按 CPU 核数计算
+        """
+        shard_count = shards or _default_shard_count()
+        if shard_count & (shard_count - 1):
+            raise ValueError(f"shards 必须是 2 的幂: {shard_count}")
+
+        # 每个分片: (LRU 顺序的 key -> (写入时刻 monotonic_ns, 缓存值),
+        #           写入顺序的 key -> 写入时刻, 分片锁)
+        # 写入顺序索引的首尾即最旧/最新条目；不同 key 落在不同分片时互不争用锁
+        self._shards: List[_Shard] = [
+            (OrderedDict(), OrderedDict(), Lock()) for _ in range(shard_count)
+        ]
+        self._mask = shard_count - 1
+        self._max = max(1, -(-maxsize // shard_count))  # 每分片容量，向上取整
+
+    def _shard(self, key: Hashable) -> _Shard:
+        """根据 key 的哈希选择分片"""
+        return self._shards[hash(key) & self._mask]
+
+    def get(self, key: Hashable, ttl: int = 900) -> Optional[Any]:
         """
         Get缓存data
 
         Args:
-            key: 缓存键
+            key: 缓存键（任意可哈希对象，如str或元组）
             ttl: 存活time（second），default15minute
 
         Returns:
             缓存的值，如果does not exist或已过期则returnNone
         """
-        with self._lock:
-            if key in self._cache:
-                # Check是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
-                else:
-                    # 已过期，Delete缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
-        return None
-
-    def set(self, key: str, value: Any) -> None:
+        cache, written, lock = self._shard(key)
+        with lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            timestamp, value = entry
+            # Check是否过期
+            if time.monotonic_ns() - timestamp >= ttl * _NS_PER_SECOND:
+                # 已过期，Delete缓存
+                del cache[key]
+                del written[key]
+                return None
+            cache.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
         """
         设置缓存data
 
         Args:
-            key: 缓存键
+            key: 缓存键（任意可哈希对象，如str或元组）
             value: 缓存值
         """
-        with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
-
-    def delete(self, key: str) -> bool:
+        cache, written, lock = self._shard(key)
+        with lock:
+            now = time.monotonic_ns()
+            cache[key] = (now, value)
+            cache.move_to_end(key)
+            written.pop(key, None)
+            written[key] = now
+            if len(cache) > self._max:
+                evicted, _ = cache.popitem(last=False)
+                del written[evicted]
+
+    def delete(self, key: Hashable) -> bool:
         """
         Delete缓存
 
         Args:
-            key: 缓存键
+            key: 缓存键（任意可哈希对象，如str或元组）
 
         Returns:
             是否successfullyDelete
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
-                return True
-        return False
+        cache, written, lock = self._shard(key)
+        with lock:
+            written.pop(key, None)
+            return cache.pop(key, None) is not None
 
     def clear(self) -> None:
         """清空所有缓存"""
-        with self._lock:
-            self._cache.clear()
-            self._timestamps.clear()
+        for cache, written, lock in self._shards:
+            with lock:
+                cache.clear()
+                written.clear()
 
     def cleanup_expired(self, ttl: int = 900) -> int:
         """
@@ -85,18 +129,35 @@ class CacheService:
         Returns:
             清理的条目数量
         """
-        with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
-            ]
+        removed = 0
+        deadline = time.monotonic_ns() - ttl * _NS_PER_SECOND
+        for cache, written, lock in self._shards:
+            with lock:
+                # 写入顺序索引按时间递增，只需从头弹出到第一个未过期条目，O(过期数)
+                while written:
+                    key = next(iter(written))
+                    if written[key] > deadline:
+                        break
+                    del written[key]
+                    del cache[key]
+                    removed += 1
+        return removed
+
+    def start_periodic_cleanup(self, interval: float = 60, ttl: int = 3600) -> None:
+        """
+        Start后台定期清理（守护线程 Timer，每 interval second清理一次）
 
-            for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
+        Args:
+            interval: 清理间隔（second）
+            ttl: 判定过期的存活time（second），应不小于各调用方use的最大 ttl
+        """
+        def _run():
+            self.cleanup_expired(ttl)
+            self.start_periodic_cleanup(interval, ttl)
 
-            return len(expired_keys)
+        timer = threading.Timer(interval, _run)
+        timer.daemon = True
+        timer.start()
 
     def get_stats(self) -> dict:
         """
@@ -105,22 +166,31 @@ class CacheService:
         Returns:
             statisticsinformationdictionary
         """
-        with self._lock:
-            return {
-                "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
-            }
-
-
-# 全局缓存实例
-_global_cache = None
+        total = 0
+        oldest = newest = None
+        # 每个分片只看写入顺序索引的首尾，O(分片数) 而非 O(条目数)
+        for _, written, lock in self._shards:
+            with lock:
+                if not written:
+                    continue
+                total += len(written)
+                first = written[next(iter(written))]
+                last = written[next(reversed(written))]
+            if oldest is None or first < oldest:
+                oldest = first
+            if newest is None or last > newest:
+                newest = last
+
+        now = time.monotonic_ns()
+        return {
+            "total_entries": total,
+            "oldest_entry_age": (now - oldest) / _NS_PER_SECOND if oldest is not None else 0,
+            "newest_entry_age": (now - newest) / _NS_PER_SECOND if newest is not None else 0
+        }
+
+
+# 全局缓存实例（import 时即创建：构造只分配空分片，避免惰性初始化的并发竞态）
+_global_cache = CacheService()
 
 
 def get_cache() -> CacheService:
@@ -130,7 +200,4 @@ def get_cache() -> CacheService:
     Returns:
         全局缓存服务实例
     """
-    global _global_cache
-    if _global_cache is None:
-        _global_cache = CacheService()
     return _global_cache
@@ -4,16 +4,80 @@ data访问服务
 提供统一的dataquery接口,封装data访问逻辑。
 """
 
+import heapq
+import os
 import re
-from collections import Counter
-from datetime import datetime, timedelta
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - 可选加速依赖
+    ahocorasick = None
+
 from .cache_service import get_cache
 from .parser_service import ParserService
 from ..utils.errors import DataNotFoundError
 
 
+# datefile夹名格式: YYYY年MM月DD日
+_DATE_FOLDER_RE = re.compile(r'(\d{4})年(\d{2})月(\d{2})日')
+
+# 后台预刷新：在缓存过期前重新计算常用query，保证用户请求命中缓存
+_REFRESH_INTERVAL = 840  # second，略短于today data的 15minute缓存
+_MAX_REFRESH_KEYS = 16   # 最多同时预刷新的query数，避免参数组合过多时Timer无限增长
+
+
+def _first_rank(info: Dict) -> int:
+    """title的第一个rank（没有rank时为0）"""
+    ranks = info["ranks"]
+    return ranks[0] if ranks else 0
+
+
+def _iter_titles(all_titles: Dict):
+    """逐条yield (platform_id, title, info)"""
+    for platform_id, titles in all_titles.items():
+        for title, info in titles.items():
+            yield platform_id, title, info
+
+
+def _top_titles(all_titles: Dict, limit: int) -> List[Tuple[str, str, Dict]]:
+    """
+    按第一个rank取前 limit 条title
+
+    生成器直接喂给 heapq.nsmallest，只保留 limit 条，不构建完整newslist；
+    同rank时的顺序与完整sort后切片一致。
+    """
+    return heapq.nsmallest(limit, _iter_titles(all_titles), key=lambda entry: _first_rank(entry[2]))
+
+
+def _walk_size(path) -> int:
+    """
+    递归统计directory下所有file的总大小（字节）
+
+    用 os.scandir 显式栈遍历，复用directory项自带的类型information，
+    不为每个file创建 Path 对象。
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
 class DataService:
     """data访问服务类"""
 
@@ -26,6 +90,71 @@ class DataService:
         """
         self.parser = ParserService(project_root)
         self.cache = get_cache()
+        # (关注词元组, 匹配函数)，关注词变化时重建
+        self._finder_cache = None
+        # 缓存键 -> 预刷新 Timer
+        self._refresh_timers = {}
+        self._refresh_lock = threading.Lock()
+        # output directory扫描result: (directory mtime_ns, ((最早date, latestdate), 子directorylist))
+        self._output_scan = None
+
+    def _keyword_finder(self, words: Tuple[str, ...]):
+        """
+        Get关注词匹配函数：title -> 其中出现的关注词list（按 words 顺序、去重）
+
+        安装了 pyahocorasick 时用 Aho-Corasick 自动机一次扫描title找出全部关注词，
+        否则逐词做子串判断。
+        """
+        cached = self._finder_cache
+        if cached is not None and cached[0] == words:
+            return cached[1]
+
+        if ahocorasick is not None and words:
+            automaton = ahocorasick.Automaton()
+            for index, word in enumerate(words):
+                automaton.add_word(word, index)
+            automaton.make_automaton()
+
+            def find(title, _iter=automaton.iter):
+                hits = {index for _, index in _iter(title)}
+                return [words[index] for index in sorted(hits)]
+        else:
+            def find(title):
+                return [word for word in words if word in title]
+
+        self._finder_cache = (words, find)
+        return find
+
+    def _schedule_refresh(self, cache_key, method, kwargs: Dict) -> None:
+        """
+        为一次缓存未命中的query安排后台预刷新（每个缓存键只安排一个 Timer）
+
+        Args:
+            cache_key: 该query的缓存键
+            method: 重新计算的方法（计算完成后会自行写回缓存并再次安排刷新）
+            kwargs: 调用参数
+        """
+        with self._refresh_lock:
+            if cache_key in self._refresh_timers or len(self._refresh_timers) >= _MAX_REFRESH_KEYS:
+                return
+            timer = threading.Timer(
+                _REFRESH_INTERVAL, self._refresh, args=(cache_key, method, kwargs)
+            )
+            timer.daemon = True
+            self._refresh_timers[cache_key] = timer
+            timer.start()
+
+    def _refresh(self, cache_key, method, kwargs: Dict) -> None:
+        """后台重新计算today的query：先让result缓存失效，再调用一次（title缓存按directory指纹自动失效）"""
+        with self._refresh_lock:
+            self._refresh_timers.pop(cache_key, None)
+
+        self.cache.delete(cache_key)
+        try:
+            method(**kwargs)
+        except Exception:
+            # data暂不可用时stop刷新，下次用户请求未命中时会重新安排
+            pass
 
     def get_latest_news(
         self,
@@ -48,7 +177,7 @@ class DataService:
             DataNotFoundError: datadoes not exist
         """
         # 尝试从缓存Get
-        cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
+        cache_key = ("latest_news", tuple(platforms or ()), limit, include_url)
         cached = self.cache.get(cache_key, ttl=900)  # 15minute缓存
         if cached:
             return cached
@@ -65,39 +194,33 @@ class DataService:
             fetch_time = datetime.fromtimestamp(latest_timestamp)
         else:
             fetch_time = datetime.now()
+        timestamp_str = fetch_time.strftime("%Y-%m-%d %H:%M:%S")
+
+        # 按rank取前 limit 条，只为选中的title构建news条目
+        result = []
+        for platform_id, title, info in _top_titles(all_titles, limit):
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": id_to_name.get(platform_id, platform_id),
+                "rank": _first_rank(info),
+                "timestamp": timestamp_str
+            }
 
-        # 转换为newslist
-        news_list = []
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
-
-            for title, info in titles.items():
-                # 取第一个rank
-                rank = info["ranks"][0] if info["ranks"] else 0
-
-                news_item = {
-                    "title": title,
-                    "platform": platform_id,
-                    "platform_name": platform_name,
-                    "rank": rank,
-                    "timestamp": fetch_time.strftime("%Y-%m-%d %H:%M:%S")
-                }
-
-                # 条件性添加 URL 字段
-                if include_url:
-                    news_item["url"] = info.get("url", "")
-                    news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                news_list.append(news_item)
-
-        # 按ranksort
-        news_list.sort(key=lambda x: x["rank"])
+            # 条件性添加 URL 字段
+            if include_url:
+                news_item["url"] = info.get("url", "")
+                news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-        # limitreturn数量
-        result = news_list[:limit]
+            result.append(news_item)
 
-        # 缓存result
+        # 缓存result，并在过期前后台预刷新
         self.cache.set(cache_key, result)
+        self._schedule_refresh(
+            cache_key,
+            self.get_latest_news,
+            {"platforms": platforms, "limit": limit, "include_url": include_url}
+        )
 
         return result
 
@@ -133,7 +256,7 @@ class DataService:
         """
         # 尝试从缓存Get
         date_str = target_date.strftime("%Y-%m-%d")
-        cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
+        cache_key = ("news_by_date", date_str, tuple(platforms or ()), limit, include_url)
         cached = self.cache.get(cache_key, ttl=1800)  # 30minute缓存
         if cached:
             return cached
@@ -144,37 +267,29 @@ class DataService:
             platform_ids=platforms
         )
 
-        # 转换为newslist
-        news_list = []
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
-
-            for title, info in titles.items():
-                # 计算平均rank
-                avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                news_item = {
-                    "title": title,
-                    "platform": platform_id,
-                    "platform_name": platform_name,
-                    "rank": info["ranks"][0] if info["ranks"] else 0,
-                    "avg_rank": round(avg_rank, 2),
-                    "count": len(info["ranks"]),
-                    "date": date_str
-                }
-
-                # 条件性添加 URL 字段
-                if include_url:
-                    news_item["url"] = info.get("url", "")
-                    news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                news_list.append(news_item)
+        # 按rank取前 limit 条，只为选中的title构建news条目
+        result = []
+        for platform_id, title, info in _top_titles(all_titles, limit):
+            ranks = info["ranks"]
+            # 计算平均rank
+            avg_rank = sum(ranks) / len(ranks) if ranks else 0
+
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": id_to_name.get(platform_id, platform_id),
+                "rank": _first_rank(info),
+                "avg_rank": round(avg_rank, 2),
+                "count": len(ranks),
+                "date": date_str
+            }
 
-        # 按ranksort
-        news_list.sort(key=lambda x: x["rank"])
+            # 条件性添加 URL 字段
+            if include_url:
+                news_item["url"] = info.get("url", "")
+                news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-        # limitreturn数量
-        result = news_list[:limit]
+            result.append(news_item)
 
         # 缓存result(historydata缓存更久)
         self.cache.set(cache_key, result)
@@ -213,45 +328,48 @@ class DataService:
         # 收集所有匹配的news
         results = []
         platform_distribution = Counter()
-
-        # 遍历date范围
-        current_date = start_date
-        while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
-
-                # searchinclude关键词的title
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
-
-                    for title, info in titles.items():
-                        if keyword.lower() in title.lower():
-                            # 计算平均rank
-                            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                            results.append({
-                                "title": title,
-                                "platform": platform_id,
-                                "platform_name": platform_name,
-                                "ranks": info["ranks"],
-                                "count": len(info["ranks"]),
-                                "avg_rank": round(avg_rank, 2),
-                                "url": info.get("url", ""),
-                                "mobileUrl": info.get("mobileUrl", ""),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
-
-                            platform_distribution[platform_id] += 1
-
-            except DataNotFoundError:
+        keyword_lower = keyword.lower()
+        # 所有匹配news的rank总和与个数（避免为求平均值再拼一个大list）
+        total_rank_sum = 0
+        total_rank_count = 0
+
+        # 遍历date范围：各天并行读取，关键词扫描仍在当前线程顺序进行
+        for current_date, day_data in self.parser.read_all_titles_for_range(
+            start_date, end_date, platform_ids=platforms
+        ):
+            if day_data is None:
                 # 该date没有data,继续下一天
-                pass
-
-            # 下一天
-            current_date += timedelta(days=1)
+                continue
+            all_titles, id_to_name, _ = day_data
+            date_str = current_date.strftime("%Y-%m-%d")
+
+            # searchinclude关键词的title
+            for platform_id, titles in all_titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
+
+                for title, info in titles.items():
+                    if keyword_lower in title.lower():
+                        # 计算平均rank
+                        ranks = info["ranks"]
+                        rank_sum = sum(ranks)
+                        rank_count = len(ranks)
+                        avg_rank = rank_sum / rank_count if rank_count else 0
+                        total_rank_sum += rank_sum
+                        total_rank_count += rank_count
+
+                        results.append({
+                            "title": title,
+                            "platform": platform_id,
+                            "platform_name": platform_name,
+                            "ranks": ranks,
+                            "count": rank_count,
+                            "avg_rank": round(avg_rank, 2),
+                            "url": info.get("url", ""),
+                            "mobileUrl": info.get("mobileUrl", ""),
+                            "date": date_str
+                        })
+
+                        platform_distribution[platform_id] += 1
 
         if not results:
             raise DataNotFoundError(
@@ -260,11 +378,7 @@ class DataService:
             )
 
         # 计算statisticsinformation
-        total_ranks = []
-        for item in results:
-            total_ranks.extend(item["ranks"])
-
-        avg_rank = sum(total_ranks) / len(total_ranks) if total_ranks else 0
+        avg_rank = total_rank_sum / total_rank_count if total_rank_count else 0
 
         # limitreturn数量(如果指定)
         total_found = len(results)
@@ -304,7 +418,7 @@ class DataService:
             DataNotFoundError: datadoes not exist
         """
         # 尝试从缓存Get
-        cache_key = f"trending_topics:{top_n}:{mode}"
+        cache_key = ("trending_topics", top_n, mode)
         cached = self.cache.get(cache_key, ttl=1800)  # 30minute缓存
         if cached:
             return cached
@@ -330,21 +444,10 @@ class DataService:
 
         elif mode == "current":
             # current模式:只Processlatest一批data(latesttime戳的file)
-            if timestamps:
-                # 找出latest的time戳
-                latest_timestamp = max(timestamps.values())
-
-                # 重新读取,只Getlatesttime的data
-                # 这里我们通过timestampsdictionary反查找latestfile对应的Platform
-                latest_titles, _, _ = self.parser.read_all_titles_for_date()
-
-                # 由于read_all_titles_for_datereturn所有file的合并data,
-                # 我们need通过timestamps来过滤出latest批次
-                # 简化实现:usecurrent所有data作为latest批次
-                # (更精确的实现needParse服务support按time过滤)
-                titles_to_process = latest_titles
-            else:
-                titles_to_process = all_titles
+            # read_all_titles_for_date return所有file的合并data,尚不support按批次过滤,
+            # 简化实现:usecurrent所有data作为latest批次
+            # (更精确的实现needParse服务support按time过滤)
+            titles_to_process = all_titles
 
         else:
             raise ValueError(
@@ -353,22 +456,32 @@ class DataService:
 
         # statistics词频
         word_frequency = Counter()
-        keyword_to_news = {}
+        keyword_to_news = defaultdict(set)
+
+        # 关注词 -> 在各关键词组中出现的次数（同一词出现在多个组时按组分别计数）
+        word_weights = Counter(
+            word
+            for group in word_groups
+            for kind in ("required", "normal")
+            for word in group.get(kind, ())
+            if word
+        )
+        find_words = self._keyword_finder(tuple(word_weights))
 
-        # 遍历要Process的title
+        # 遍历要Process的title：先按命中title数计数（Counter.update 在 C 层累加）
         for platform_id, titles in titles_to_process.items():
-            for title in titles.keys():
-                # 对每个关键词组进行匹配
-                for group in word_groups:
-                    all_words = group.get("required", []) + group.get("normal", [])
-
-                    for word in all_words:
-                        if word and word in title:
-                            word_frequency[word] += 1
-
-                            if word not in keyword_to_news:
-                                keyword_to_news[word] = []
-                            keyword_to_news[word].append(title)
+            for title in titles:
+                matches = find_words(title)
+                if matches:
+                    word_frequency.update(matches)
+                    for word in matches:
+                        keyword_to_news[word].add(title)
+
+        # 再乘上关注词在关键词组中的出现次数
+        for word, count in word_frequency.items():
+            weight = word_weights[word]
+            if weight != 1:
+                word_frequency[word] = count * weight
 
         # GetTOP N关键词
         top_keywords = word_frequency.most_common(top_n)
@@ -376,12 +489,12 @@ class DataService:
         # 构建话题list
         topics = []
         for keyword, frequency in top_keywords:
-            matched_news = keyword_to_news.get(keyword, [])
+            matched_news = keyword_to_news.get(keyword, ())
 
             topics.append({
                 "keyword": keyword,
                 "frequency": frequency,
-                "matched_news": len(set(matched_news)),  # 去重后的news数量
+                "matched_news": len(matched_news),  # 去重后的news数量
                 "trend": "stable",  # TODO: needhistorydata来计算趋势
                 "weight_score": 0.0  # TODO: need实现权重计算
             })
@@ -395,8 +508,13 @@ class DataService:
             "description": self._get_mode_description(mode)
         }
 
-        # 缓存result
+        # 缓存result，并在过期前后台预刷新
         self.cache.set(cache_key, result)
+        self._schedule_refresh(
+            cache_key,
+            self.get_trending_topics,
+            {"top_n": top_n, "mode": mode}
+        )
 
         return result
 
@@ -422,71 +540,30 @@ class DataService:
             FileParseError: 配置File parse error
         """
         # 尝试从缓存Get
-        cache_key = f"config:{section}"
+        cache_key = ("config", section)
         cached = self.cache.get(cache_key, ttl=3600)  # 1hour缓存
         if cached:
             return cached
 
         # Parseconfiguration file
         config_data = self.parser.parse_yaml_config()
-        word_groups = self.parser.parse_frequency_words()
 
-        # 根据sectionreturn对应配置
-        if section == "all" or section == "crawler":
-            crawler_config = {
-                "enable_crawler": config_data.get("crawler", {}).get("enable_crawler", True),
-                "use_proxy": config_data.get("crawler", {}).get("use_proxy", False),
-                "request_interval": config_data.get("crawler", {}).get("request_interval", 1),
-                "retry_times": 3,
-                "platforms": [p["id"] for p in config_data.get("platforms", [])]
-            }
-
-        if section == "all" or section == "push":
-            push_config = {
-                "enable_notification": config_data.get("notification", {}).get("enable_notification", True),
-                "enabled_channels": [],
-                "message_batch_size": config_data.get("notification", {}).get("message_batch_size", 20),
-                "push_window": config_data.get("notification", {}).get("push_window", {})
-            }
-
-            # 检测已配置的notification渠道
-            webhooks = config_data.get("notification", {}).get("webhooks", {})
-            if webhooks.get("feishu_url"):
-                push_config["enabled_channels"].append("feishu")
-            if webhooks.get("dingtalk_url"):
-                push_config["enabled_channels"].append("dingtalk")
-            if webhooks.get("wework_url"):
-                push_config["enabled_channels"].append("wework")
-
-        if section == "all" or section == "keywords":
-            keywords_config = {
-                "word_groups": word_groups,
-                "total_groups": len(word_groups)
-            }
-
-        if section == "all" or section == "weights":
-            weights_config = {
-                "rank_weight": config_data.get("weight", {}).get("rank_weight", 0.6),
-                "frequency_weight": config_data.get("weight", {}).get("frequency_weight", 0.3),
-                "hotness_weight": config_data.get("weight", {}).get("hotness_weight", 0.1)
-            }
-
-        # 组装result
+        # 根据sectionreturn对应配置（关键词file只在need时Parse）
         if section == "all":
             result = {
-                "crawler": crawler_config,
-                "push": push_config,
-                "keywords": keywords_config,
-                "weights": weights_config
+                "crawler": self._crawler_config(config_data),
+                "push": self._push_config(config_data),
+                "keywords": self._keywords_config(),
+                "weights": self._weights_config(config_data)
             }
         elif section == "crawler":
-            result = crawler_config
+            result = self._crawler_config(config_data)
         elif section == "push":
-            result = push_config
+            result = self._push_config(config_data)
         elif section == "keywords":
-            result = keywords_config
+            result = self._keywords_config()
         elif section == "weights":
-            result = weights_config
+            result = self._weights_config(config_data)
         else:
             result = {}
 
@@ -495,6 +572,107 @@ class DataService:
 
         return result
 
+    def _crawler_config(self, config_data: Dict) -> Dict:
+        """爬虫配置节"""
+        crawler = config_data.get("crawler", {})
+        return {
+            "enable_crawler": crawler.get("enable_crawler", True),
+            "use_proxy": crawler.get("use_proxy", False),
+            "request_interval": crawler.get("request_interval", 1),
+            "retry_times": 3,
+            "platforms": [p["id"] for p in config_data.get("platforms", [])]
+        }
+
+    def _push_config(self, config_data: Dict) -> Dict:
+        """推送配置节"""
+        notification = config_data.get("notification", {})
+        push_config = {
+            "enable_notification": notification.get("enable_notification", True),
+            "enabled_channels": [],
+            "message_batch_size": notification.get("message_batch_size", 20),
+            "push_window": notification.get("push_window", {})
+        }
+
+        # 检测已配置的notification渠道
+        webhooks = notification.get("webhooks", {})
+        if webhooks.get("feishu_url"):
+            push_config["enabled_channels"].append("feishu")
+        if webhooks.get("dingtalk_url"):
+            push_config["enabled_channels"].append("dingtalk")
+        if webhooks.get("wework_url"):
+            push_config["enabled_channels"].append("wework")
+
+        return push_config
+
+    def _keywords_config(self) -> Dict:
+        """关键词配置节"""
+        word_groups = self.parser.parse_frequency_words()
+        return {
+            "word_groups": word_groups,
+            "total_groups": len(word_groups)
+        }
+
+    def _weights_config(self, config_data: Dict) -> Dict:
+        """权重配置节"""
+        weight = config_data.get("weight", {})
+        return {
+            "rank_weight": weight.get("rank_weight", 0.6),
+            "frequency_weight": weight.get("frequency_weight", 0.3),
+            "hotness_weight": weight.get("hotness_weight", 0.1)
+        }
+
+    def _scan_output(self) -> Tuple[Tuple[Optional[datetime], Optional[datetime]], List[str]]:
+        """
+        一次 os.scandir 扫描 output directory
+
+        新增/Deletedatefile夹都会改变directory mtime，未变化时直接复用上次扫描result。
+
+        Returns:
+            ((最早date, latestdate), 所有子directorypathlist)，没有data时date为 (None, None)
+        """
+        output_dir = self.parser.project_root / "output"
+
+        try:
+            output_mtime = os.stat(output_dir).st_mtime_ns
+        except OSError:
+            return (None, None), []
+
+        cached = self._output_scan
+        if cached is not None and cached[0] == output_mtime:
+            return cached[1]
+
+        earliest = latest = None
+        folders = []
+        match_date = _DATE_FOLDER_RE.match
+
+        # 遍历datefile夹
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                try:
+                    if not entry.is_dir():
+                        continue
+                except OSError:
+                    continue
+                folders.append(entry.path)
+
+                # Parsedate（格式: YYYY年MM月DD日）
+                date_match = match_date(entry.name)
+                if not date_match:
+                    continue
+                try:
+                    folder_date = datetime(*map(int, date_match.groups()))
+                except ValueError:
+                    continue
+
+                if earliest is None or folder_date < earliest:
+                    earliest = folder_date
+                if latest is None or folder_date > latest:
+                    latest = folder_date
+
+        result = ((earliest, latest), folders)
+        self._output_scan = (output_mtime, result)
+        return result
+
     def get_available_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
         """
         扫描 output directory，return实际可用的date范围
@@ -507,33 +685,7 @@ class DataService:
             >>> earliest, latest = service.get_available_date_range()
             >>> print(f"可用date范围：{earliest} to {latest}")
         """
-        output_dir = self.parser.project_root / "output"
-
-        if not output_dir.exists():
-            return (None, None)
-
-        available_dates = []
-
-        # 遍历datefile夹
-        for date_folder in output_dir.iterdir():
-            if date_folder.is_dir() and not date_folder.name.startswith('.'):
-                # Parsedate（格式: YYYY年MM月DD日）
-                try:
-                    date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_folder.name)
-                    if date_match:
-                        folder_date = datetime(
-                            int(date_match.group(1)),
-                            int(date_match.group(2)),
-                            int(date_match.group(3))
-                        )
-                        available_dates.append(folder_date)
-                except Exception:
-                    pass
-
-        if not available_dates:
-            return (None, None)
-
-        return (min(available_dates), max(available_dates))
+        return self._scan_output()[0]
 
     def get_system_status(self) -> Dict:
         """
@@ -542,42 +694,9 @@ class DataService:
         Returns:
             系统状态dictionary
         """
-        # Getdatastatistics
-        output_dir = self.parser.project_root / "output"
-
-        total_storage = 0
-        oldest_record = None
-        latest_record = None
-        total_news = 0
-
-        if output_dir.exists():
-            # 遍历datefile夹
-            for date_folder in output_dir.iterdir():
-                if date_folder.is_dir():
-                    # Parsedate
-                    try:
-                        date_str = date_folder.name
-                        # 格式: YYYY年MM月DD日
-                        date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_str)
-                        if date_match:
-                            folder_date = datetime(
-                                int(date_match.group(1)),
-                                int(date_match.group(2)),
-                                int(date_match.group(3))
-                            )
-
-                            if oldest_record is None or folder_date < oldest_record:
-                                oldest_record = folder_date
-                            if latest_record is None or folder_date > latest_record:
-                                latest_record = folder_date
-
-                    except:
-                        pass
-
-                    # 计算存储大小
-                    for item in date_folder.rglob("*"):
-                        if item.is_file():
-                            total_storage += item.stat().st_size
+        # Getdatastatistics（date范围复用 output directory扫描；file大小随时可能变化，每次重新统计）
+        (oldest_record, latest_record), folders = self._scan_output()
+        total_storage = sum(_walk_size(folder) for folder in folders)
 
         # 读取版本information
         version_file = self.parser.project_root / "version"
@@ -4,16 +4,47 @@ fileParse服务
 提供txt格式newsdata和YAMLconfiguration file的Parse功能。
 """
 
+import os
 import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C 实现
+except ImportError:  # pragma: no cover - 未编译 libyaml 时退回纯 Python 实现
+    from yaml import SafeLoader as _YamlLoader
+
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
 
+# txt 行内分隔符（模块级常量，避免在内层循环里重复写字面量和魔法偏移）
+_FAILED_MARKER = "==== 以下ID请求failed ===="
+_HEADER_SEP = " | "
+_RANK_SEP = ". "
+_MOBILE_TAG = " [MOBILE:"
+_URL_TAG = " [URL:"
+
+# frequency_words.txt 中一个词：| 或 , 之间去掉首尾空白后的非空文本
+_WORD_TOKEN_RE = re.compile(r"[^,|\s](?:[^,|]*[^,|\s])?")
+
+# txt 读取缓冲区大小：大file按 64KB 块顺序读入，减少 read 系统调用次数
+_READ_BUFFER_SIZE = 1 << 16
+
+# fileParse缓存最多保留的 txt file数（LRU 淘汰，约覆盖最近几天的抓取结果）
+_MAX_FILE_CACHE = 512
+
+
+def _daterange(start_date: datetime, end_date: datetime) -> List[datetime]:
+    """[start_date, end_date] 内的每一天（include两端）"""
+    return [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
 
 class ParserService:
     """fileParse服务类"""
@@ -35,6 +66,15 @@ class ParserService:
         # Initialize缓存服务
         self.cache = get_cache()
 
+        # 单个 txt file的Parseresult: path -> (mtime_ns, size, (titles_by_id, id_to_name))
+        # file未修改时直接复用，新增一个file只需Parse这一个；按最近use顺序排列，超出上限淘汰最久未用的
+        self._file_cache: OrderedDict = OrderedDict()
+        self._file_cache_lock = threading.Lock()
+
+        # configuration fileParseresult: path -> (mtime_ns, 值)，file未修改时直接return（调用方不得修改）
+        self._yaml_cache: Dict[Path, Tuple[int, dict]] = {}
+        self._words_cache: Dict[Path, Tuple[int, List[Dict]]] = {}
+
     @staticmethod
     def clean_title(title: str) -> str:
         """
@@ -46,11 +86,87 @@ class ParserService:
         Returns:
             清理后的title
         """
-        # 移除多余空白
-        title = re.sub(r'\s+', ' ', title)
-        # 移除特殊字符
-        title = title.strip()
-        return title
+        # 合并连续空白并去掉首尾空白（str.split() 的空白定义与 \s 一致）
+        return ' '.join(title.split())
+
+    def _parse_section(
+        self,
+        lines: List[str],
+        titles_by_id: Dict,
+        id_to_name: Dict
+    ) -> None:
+        """
+        Parse txt file中的一个section（header行 + title行），result写入 titles_by_id / id_to_name
+
+        Args:
+            lines: section内的原始行（不含换行符）
+            titles_by_id: {platform_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: {platform_id: platform_name}
+        """
+        # 去掉首尾的空白行（等价于对整个section做 strip）
+        first = 0
+        last = len(lines) - 1
+        while first <= last and not lines[first].strip():
+            first += 1
+        while last >= first and not lines[last].strip():
+            last -= 1
+        if last - first < 1:
+            return
+        lines = lines[first:last + 1]
+
+        # Parseheader: id | name 或 id
+        # Platform ID 和title在一天的上百个file中反复出现，intern 后各file共享同一字符串对象，
+        # 合并时的dictionary查找走身份比较快路径，缓存的多份Parseresult也不再各存一份副本
+        header_line = lines[0].strip()
+        source_id, sep, name = header_line.partition(_HEADER_SEP)
+        if sep:
+            source_id = sys.intern(source_id.strip())
+            id_to_name[source_id] = name.strip()
+        else:
+            source_id = sys.intern(header_line)
+            id_to_name[source_id] = source_id
+
+        titles_by_id[source_id] = {}
+
+        # Parsetitle行
+        platform_titles = titles_by_id[source_id]
+        for line in lines[1:]:
+            title_part = line.strip()
+            if not title_part:
+                continue
+            rank = 1
+
+            # 提取rank（"N. title"）
+            dot = title_part.find(_RANK_SEP)
+            if dot != -1 and title_part[:dot].isdigit():
+                try:
+                    rank = int(title_part[:dot])
+                except ValueError:
+                    # isdigit() 接受上标等 int() 不认的字符，这类行整行忽略
+                    continue
+                title_part = title_part[dot + len(_RANK_SEP):]
+
+            # 提取 MOBILE URL（从右往左找，切片代替 rsplit）
+            mobile_url = ""
+            pos = title_part.rfind(_MOBILE_TAG)
+            if pos != -1:
+                if title_part.endswith("]"):
+                    mobile_url = title_part[pos + len(_MOBILE_TAG):-1]
+                title_part = title_part[:pos]
+
+            # 提取 URL
+            url = ""
+            pos = title_part.rfind(_URL_TAG)
+            if pos != -1:
+                if title_part.endswith("]"):
+                    url = title_part[pos + len(_URL_TAG):-1]
+                title_part = title_part[:pos]
+
+            platform_titles[sys.intern(self.clean_title(title_part))] = {
+                "ranks": [rank],
+                "url": url,
+                "mobileUrl": mobile_url,
+            }
 
     def parse_txt_file(self, file_path: Path) -> Tuple[Dict, Dict]:
         """
@@ -74,75 +190,79 @@ class ParserService:
         id_to_name = {}
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                sections = content.split("\n\n")
-
-                for section in sections:
-                    if not section.strip() or "==== 以下ID请求failed ====" in section:
-                        continue
-
-                    lines = section.strip().split("\n")
-                    if len(lines) < 2:
-                        continue
-
-                    # Parseheader: id | name 或 id
-                    header_line = lines[0].strip()
-                    if " | " in header_line:
-                        parts = header_line.split(" | ", 1)
-                        source_id = parts[0].strip()
-                        name = parts[1].strip()
-                        id_to_name[source_id] = name
-                    else:
-                        source_id = header_line
-                        id_to_name[source_id] = source_id
-
-                    titles_by_id[source_id] = {}
-
-                    # Parsetitle行
-                    for line in lines[1:]:
-                        if line.strip():
-                            try:
-                                title_part = line.strip()
-                                rank = None
-
-                                # 提取rank
-                                if ". " in title_part and title_part.split(". ")[0].isdigit():
-                                    rank_str, title_part = title_part.split(". ", 1)
-                                    rank = int(rank_str)
-
-                                # 提取 MOBILE URL
-                                mobile_url = ""
-                                if " [MOBILE:" in title_part:
-                                    title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                                    if mobile_part.endswith("]"):
-                                        mobile_url = mobile_part[:-1]
-
-                                # 提取 URL
-                                url = ""
-                                if " [URL:" in title_part:
-                                    title_part, url_part = title_part.rsplit(" [URL:", 1)
-                                    if url_part.endswith("]"):
-                                        url = url_part[:-1]
-
-                                title = self.clean_title(title_part.strip())
-                                ranks = [rank] if rank is not None else [1]
-
-                                titles_by_id[source_id][title] = {
-                                    "ranks": ranks,
-                                    "url": url,
-                                    "mobileUrl": mobile_url,
-                                }
-
-                            except Exception as e:
-                                # 忽略单行Parseerror
-                                continue
+            # 逐行读取，空行即section分隔（等价于按 "\n\n" 切分），内存只保留当前section
+            with open(file_path, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
+                section_lines = []
+                for line in f:
+                    line = line.rstrip("\n")
+                    if line:
+                        if not section_lines and _FAILED_MARKER in line:
+                            # failedIDlist总是写在file末尾的最后一个section，后面不再有title
+                            break
+                        section_lines.append(line)
+                    elif section_lines:
+                        self._parse_section(section_lines, titles_by_id, id_to_name)
+                        section_lines = []
+                if section_lines:
+                    self._parse_section(section_lines, titles_by_id, id_to_name)
 
         except Exception as e:
             raise FileParseError(str(file_path), str(e))
 
         return titles_by_id, id_to_name
 
+    def _parse_txt_cached(self, path: str, stat: os.stat_result) -> Tuple[Dict, Dict]:
+        """
+        Parse txt file（按 mtime + size 复用上次Parseresult）
+
+        returnresult被缓存共享，调用方不得修改。
+        """
+        with self._file_cache_lock:
+            cached = self._file_cache.get(path)
+            if self._file_cache_fresh(cached, stat):
+                self._file_cache.move_to_end(path)
+                return cached[2]
+
+        parsed = self.parse_txt_file(Path(path))
+        with self._file_cache_lock:
+            self._file_cache[path] = (stat.st_mtime_ns, stat.st_size, parsed)
+            self._file_cache.move_to_end(path)
+            while len(self._file_cache) > _MAX_FILE_CACHE:
+                self._file_cache.popitem(last=False)
+        return parsed
+
+    @staticmethod
+    def _file_cache_fresh(cached: Optional[Tuple], stat: os.stat_result) -> bool:
+        """fileParse缓存条目是否仍对应该file的current内容"""
+        return cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size
+
+    def _prefetch_txt_files(self, entries: List[os.DirEntry]) -> None:
+        """
+        用线程池并行Parse尚未缓存（或已修改）的 txt file，result写入fileParse缓存
+
+        Parseerror在这里忽略，之后顺序合并时会再次Parse并输出警告。
+        """
+        pending = []
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if not self._file_cache_fresh(self._file_cache.get(entry.path), stat):
+                pending.append((entry.path, stat))
+
+        if len(pending) < 2:
+            return
+
+        def parse(item):
+            try:
+                self._parse_txt_cached(*item)
+            except Exception:
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            list(executor.map(parse, pending))
+
     def get_date_folder_name(self, date: datetime = None) -> str:
         """
         Getdatefile夹名称
@@ -157,6 +277,21 @@ class ParserService:
             date = datetime.now()
         return date.strftime("%Y年%m月%d日")
 
+    @staticmethod
+    def _dir_fingerprint(entries: List[os.DirEntry]) -> Tuple[int, int, int]:
+        """txt directory指纹: (file数, 最大 mtime_ns, 总大小)"""
+        max_mtime = 0
+        total_size = 0
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if stat.st_mtime_ns > max_mtime:
+                max_mtime = stat.st_mtime_ns
+            total_size += stat.st_size
+        return (len(entries), max_mtime, total_size)
+
     def read_all_titles_for_date(
         self,
         date: datetime = None,
@@ -178,37 +313,42 @@ class ParserService:
         Raises:
             DataNotFoundError: datadoes not exist
         """
-        # Generate缓存键
-        date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all_titles:{date_str}:{platform_key}"
-
-        # 尝试从缓存Get
-        # 对于historydata（非today），use更长的缓存time（1hour）
-        # 对于today的data，use较短的缓存time（15minute），因为可能有新data
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600  # 15minute vs 1hour
-
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
-
-        # 缓存未命中，读取file
         date_folder = self.get_date_folder_name(date)
+
+        if platform_ids:
+            # 每个 txt file都include所有Platform（file名只是抓取time），无法按file预筛；
+            # 直接从（已缓存的）全Platform合并result中取出所需Platform，各种Platform组合共享一次合并
+            full_titles, id_to_name, all_timestamps = self.read_all_titles_for_date(date)
+            wanted = set(platform_ids)
+            all_titles = {
+                platform_id: titles
+                for platform_id, titles in full_titles.items()
+                if platform_id in wanted
+            }
+            if not all_titles:
+                raise DataNotFoundError(
+                    f"{date_folder} 没有有效的data",
+                    suggestion="请Checkdatafile格式或重新运行爬虫"
+                )
+            return (all_titles, id_to_name, all_timestamps)
+
         txt_dir = self.project_root / "output" / date_folder / "txt"
 
-        if not txt_dir.exists():
+        # 读取所有txtfile：scandir 直接给出file名和类型（不再单独 exists()），
+        # 每个 DirEntry 的 stat() 只调用一次并被缓存，指纹、预Parse和合并共用
+        try:
+            with os.scandir(txt_dir) as it:
+                txt_files = sorted(
+                    (entry for entry in it if entry.name.endswith(".txt") and entry.is_file()),
+                    key=lambda entry: entry.name
+                )
+        except FileNotFoundError:
             raise DataNotFoundError(
                 f"未找到 {date_folder} 的datadirectory",
                 suggestion="请先运行爬虫或Checkdate是否正确"
             )
-
-        all_titles = {}
-        id_to_name = {}
-        all_timestamps = {}
-
-        # 读取所有txtfile
-        txt_files = sorted(txt_dir.glob("*.txt"))
+        except NotADirectoryError:
+            txt_files = []
 
         if not txt_files:
             raise DataNotFoundError(
@@ -216,37 +356,69 @@ class ParserService:
                 suggestion="Please wait爬虫任务完成"
             )
 
+        # 缓存键带上directory指纹（file数、最大 mtime、总大小）：
+        # 新增或修改file即自然失效，未变化时一直命中，无需按 TTL 重新Parse
+        cache_key = ("read_all_titles", date_folder, self._dir_fingerprint(txt_files))
+        cached = self.cache.get(cache_key, ttl=86400)
+        if cached:
+            return cached
+
+        all_titles = {}
+        id_to_name = {}
+        all_timestamps = {}
+
+        # 冷启动时多个file待Parse：先并行Parse进缓存，再按file名顺序合并
+        self._prefetch_txt_files(txt_files)
+        # 合并过程中新建的 info 的 id（这些可以原地追加 ranks）
+        merged = set()
+        # Parsefailed的file，循环结束后统一输出一次
+        errors = []
+
         for txt_file in txt_files:
             try:
-                titles_by_id, file_id_to_name = self.parse_txt_file(txt_file)
+                stat = txt_file.stat()
+                titles_by_id, file_id_to_name = self._parse_txt_cached(txt_file.path, stat)
 
                 # Updateid_to_name
                 id_to_name.update(file_id_to_name)
 
                 # 合并titledata
                 for platform_id, titles in titles_by_id.items():
-                    # 如果指定了Platform过滤
-                    if platform_ids and platform_id not in platform_ids:
-                        continue
-
-                    if platform_id not in all_titles:
-                        all_titles[platform_id] = {}
+                    platform_titles = all_titles.setdefault(platform_id, {})
 
                     for title, info in titles.items():
-                        if title in all_titles[platform_id]:
-                            # 合并rank
-                            all_titles[platform_id][title]["ranks"].extend(info["ranks"])
+                        existing = platform_titles.get(title)
+                        if existing is None:
+                            # 直接引用（缓存中的）单fileParseresult，不复制
+                            platform_titles[title] = info
+                        elif id(existing) in merged:
+                            # 合并rank（单fileParse出的 ranks 只有一个元素）
+                            ranks = info["ranks"]
+                            if len(ranks) == 1:
+                                existing["ranks"].append(ranks[0])
+                            else:
+                                existing["ranks"].extend(ranks)
                         else:
-                            all_titles[platform_id][title] = info.copy()
+                            # 第一次出现重复title时才复制（写时复制），避免改动缓存的Parseresult
+                            existing = dict(existing, ranks=existing["ranks"] + info["ranks"])
+                            platform_titles[title] = existing
+                            merged.add(id(existing))
 
                 # recordfiletime戳
-                all_timestamps[txt_file.name] = txt_file.stat().st_mtime
+                all_timestamps[txt_file.name] = stat.st_mtime
 
             except Exception as e:
                 # 忽略单个file的Parseerror，继续Process其他file
-                print(f"Warning: Failed to parse file {txt_file} failed: {e}")
+                errors.append((txt_file.path, e))
                 continue
 
+        if errors:
+            # 写到 stderr：stdio 模式下 stdout 是 MCP 协议通道
+            print(
+                "\n".join(f"Warning: Failed to parse file {path} failed: {e}" for path, e in errors),
+                file=sys.stderr
+            )
+
         if not all_titles:
             raise DataNotFoundError(
                 f"{date_folder} 没有有效的data",
@@ -259,6 +431,50 @@ class ParserService:
 
         return result
 
+    def read_all_titles_for_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None
+    ) -> List[Tuple[datetime, Optional[Tuple[Dict, Dict, Dict]]]]:
+        """
+        读取date范围内每一天的titledata（只扫描一次 output directory）
+
+        Args:
+            start_date: 开始date
+            end_date: 结束date（include）
+            platform_ids: List of platform IDs，None表示所有Platform
+
+        Returns:
+            [(date, read_all_titles_for_date 的result或None), ...]，按date升序，
+            没有data的date为None
+        """
+        # 一次 scandir 拿到所有datedirectory，没有directory的date不必再逐个探测、抛异常
+        try:
+            with os.scandir(self.project_root / "output") as it:
+                folders = {entry.name for entry in it if entry.is_dir()}
+        except OSError:
+            folders = set()
+
+        dates = _daterange(start_date, end_date)
+        has_data = [self.get_date_folder_name(date) in folders for date in dates]
+
+        def read(date, exists):
+            if not exists:
+                return None
+            try:
+                return self.read_all_titles_for_date(date=date, platform_ids=platform_ids)
+            except DataNotFoundError:
+                return None
+
+        # 各天互相独立，file读取是 IO 密集的：多天有data时并行读取（result仍按date顺序return）
+        pending = sum(has_data)
+        if pending <= 1:
+            return [(date, read(date, exists)) for date, exists in zip(dates, has_data)]
+
+        with ThreadPoolExecutor(max_workers=min(8, pending)) as executor:
+            return list(zip(dates, executor.map(read, dates, has_data)))
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         ParseYAMLconfiguration file
@@ -277,16 +493,24 @@ class ParserService:
         else:
             config_path = Path(config_path)
 
-        if not config_path.exists():
+        try:
+            mtime = config_path.stat().st_mtime_ns
+        except OSError:
             raise FileParseError(str(config_path), "configuration filedoes not exist")
 
+        cached = self._yaml_cache.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
-            return config_data
+                config_data = yaml.load(f, Loader=_YamlLoader)
         except Exception as e:
             raise FileParseError(str(config_path), str(e))
 
+        self._yaml_cache[config_path] = (mtime, config_data)
+        return config_data
+
     def parse_frequency_words(self, words_file: str = None) -> List[Dict]:
         """
         Parse关键词configuration file
@@ -305,51 +529,50 @@ class ParserService:
         else:
             words_file = Path(words_file)
 
-        if not words_file.exists():
+        try:
+            mtime = words_file.stat().st_mtime_ns
+        except OSError:
             return []
 
+        cached = self._words_cache.get(words_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         word_groups = []
 
         try:
             with open(words_file, "r", encoding="utf-8") as f:
                 for line in f:
                     line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # use | 分隔符
-                    parts = [p.strip() for p in line.split("|")]
-                    if not parts:
+                    if not line or line[0] == "#":
                         continue
 
-                    group = {
-                        "required": [],
-                        "normal": [],
-                        "filter_words": []
-                    }
-
-                    for part in parts:
-                        if not part:
-                            continue
-
-                        words = [w.strip() for w in part.split(",")]
-                        for word in words:
-                            if not word:
-                                continue
-                            if word.endswith("+"):
-                                # 必须词
-                                group["required"].append(word[:-1])
-                            elif word.endswith("!"):
-                                # 过滤词
-                                group["filter_words"].append(word[:-1])
-                            else:
-                                # 普通词
-                                group["normal"].append(word)
+                    required = []
+                    normal = []
+                    filter_words = []
+
+                    # 一次扫描取出 | 和 , 分隔的所有词（已去掉首尾空白），按末尾标记分类
+                    for word in _WORD_TOKEN_RE.findall(line):
+                        marker = word[-1]
+                        if marker == "+":
+                            # 必须词
+                            required.append(word[:-1])
+                        elif marker == "!":
+                            # 过滤词
+                            filter_words.append(word[:-1])
+                        else:
+                            # 普通词
+                            normal.append(word)
 
-                    if group["required"] or group["normal"]:
-                        word_groups.append(group)
+                    if required or normal:
+                        word_groups.append({
+                            "required": required,
+                            "normal": normal,
+                            "filter_words": filter_words
+                        })
 
         except Exception as e:
             raise FileParseError(str(words_file), str(e))
 
+        self._words_cache[words_file] = (mtime, word_groups)
         return word_groups
@@ -4,10 +4,13 @@
 提供热度趋势analysis、Platform对比、关键词共现、情感analysis等高级analysis功能。
 """
 
+import heapq
 import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import chain, combinations, islice
+from typing import Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 
 from ..services.data_service import DataService
@@ -20,6 +23,47 @@ from ..utils.validators import (
 )
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
+# 关键词提取用到的正则与停用词（模块级预编译，避免每次调用重新查正则缓存、重建集合）
+_URL_RE = re.compile(r'http[s]?://\S+')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WORD_SPLIT_RE = re.compile(r'[\s，。！？、]+')
+_STOPWORDS = frozenset({'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'})
+
+# txt file名中的time（格式：HHMM.txt）
+_FILENAME_TIME_RE = re.compile(r'(\d{2})(\d{2})\.txt')
+
+
+@lru_cache(maxsize=1 << 16)
+def _lower(text: str) -> str:
+    """title的小写形式（同一title在多天、多次analysis中反复出现，缓存避免重复转换）"""
+    return text.lower()
+
+
+@lru_cache(maxsize=1 << 16)
+def _title_keywords(title: str, min_length: int = 2) -> Tuple[str, ...]:
+    """
+    从title中提取关键词（按title缓存：同一title的分词result在各工具、各天之间复用）
+
+    Args:
+        title: title文本
+        min_length: 最小关键词长度
+
+    Returns:
+        关键词元组
+    """
+    # 移除URL和特殊字符
+    title = _URL_RE.sub('', title)
+    title = _NON_WORD_RE.sub(' ', title)
+
+    # 简单分词（按空格和常见分隔符），过滤停用词和短词
+    keywords = []
+    for word in _WORD_SPLIT_RE.split(title):
+        word = word.strip()
+        if word and len(word) >= min_length and word not in _STOPWORDS:
+            keywords.append(word)
+
+    return tuple(keywords)
+
 
 def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     """
@@ -48,20 +92,23 @@ def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     FREQUENCY_WEIGHT = 0.3
     HOTNESS_WEIGHT = 0.1
 
-    # 1. rank权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
+    # 一次遍历 ranks 同时累计rank得分与高rank次数
+    rank_score_sum = 0
+    high_rank_count = 0
     for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+        rank_score_sum += 11 - (rank if rank < 10 else 10)
+        if rank <= rank_threshold:
+            high_rank_count += 1
+    rank_count = len(ranks)
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+    # 1. rank权重：Σ(11 - min(rank, 10)) / 出现次数
+    rank_weight = rank_score_sum / rank_count
 
     # 2. 频次权重：min(出现次数, 10) × 10
     frequency_weight = min(count, 10) * 10
 
     # 3. 热度加成：高rank次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
+    hotness_ratio = high_rank_count / rank_count
     hotness_weight = hotness_ratio * 100
 
     # 综合权重
@@ -306,59 +353,57 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集趋势data
+            # 收集趋势data（同时累计statistics指标：总数、峰值及其位置、首个非零值）
             trend_data = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+            topic_lower = topic.lower()
+            total_mentions = 0
+            max_count = 0
+            peak_index = 0
+            first_non_zero = 0
+            for current_date, day_data in self.data_service.parser.read_all_titles_for_range(
+                start_date, end_date
+            ):
+                all_titles = day_data[0] if day_data else {}
+
+                # statistics该time点的话题出现次数
+                count = 0
+                matched_titles = []
 
-                    # statistics该time点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
+                for _, titles in all_titles.items():
+                    for title in titles.keys():
+                        if topic_lower in _lower(title):
+                            count += 1
+                            # 只保留前3个样本
+                            if len(matched_titles) < 3:
                                 matched_titles.append(title)
 
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
-
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
-
-                # 按天增加time
-                current_date += timedelta(days=1)
+                if count > max_count:
+                    max_count = count
+                    peak_index = len(trend_data)
+                if not first_non_zero:
+                    first_non_zero = count
+                total_mentions += count
+
+                trend_data.append({
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "count": count,
+                    "sample_titles": matched_titles
+                })
 
             # 计算趋势指标
-            counts = [item["count"] for item in trend_data]
+            days_count = len(trend_data)
             total_days = (end_date - start_date).days + 1
 
-            if len(counts) >= 2:
+            if days_count >= 2:
                 # 计算涨跌幅度
-                first_non_zero = next((c for c in counts if c > 0), 0)
-                last_count = counts[-1]
+                last_count = trend_data[-1]["count"]
 
                 if first_non_zero > 0:
                     change_rate = ((last_count - first_non_zero) / first_non_zero) * 100
                 else:
                     change_rate = 0
 
-                # 找到峰值time
-                max_count = max(counts)
-                peak_index = counts.index(max_count)
+                # 峰值time（第一次达到最大值的那天）
                 peak_time = trend_data[peak_index]["date"]
             else:
                 change_rate = 0
@@ -376,8 +421,8 @@ class AnalyticsTools:
                 "granularity": granularity,
                 "trend_data": trend_data,
                 "statistics": {
-                    "total_mentions": sum(counts),
-                    "average_mentions": round(sum(counts) / len(counts), 2) if counts else 0,
+                    "total_mentions": total_mentions,
+                    "average_mentions": round(total_mentions / days_count, 2) if days_count else 0,
                     "peak_count": max_count,
                     "peak_time": peak_time,
                     "change_rate": round(change_rate, 2)
@@ -449,32 +494,33 @@ class AnalyticsTools:
             })
 
             # 遍历date范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
+            topic_lower = topic.lower() if topic else None
+            for current_date, day_data in self.data_service.parser.read_all_titles_for_range(
+                start_date, end_date
+            ):
+                if day_data is None:
+                    continue
+                all_titles, id_to_name, _ = day_data
 
-                        for title in titles.keys():
-                            platform_stats[platform_name]["total_news"] += 1
-                            platform_stats[platform_name]["unique_titles"].add(title)
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    stats = platform_stats[platform_name]
 
-                            # 如果指定了话题，statisticsinclude话题的news
-                            if topic and topic.lower() in title.lower():
-                                platform_stats[platform_name]["topic_mentions"] += 1
+                    # 去重title集合只保存对（已 intern、被Parse缓存持有的）title的引用，整批并入
+                    stats["unique_titles"].update(titles)
 
-                            # 提取关键词（简单分词）
-                            keywords = self._extract_keywords(title)
-                            platform_stats[platform_name]["top_keywords"].update(keywords)
+                    stats["total_news"] += len(titles)
 
-                except DataNotFoundError:
-                    pass
+                    # 如果指定了话题，statisticsinclude话题的news（未指定时整段跳过）
+                    if topic_lower:
+                        stats["topic_mentions"] += sum(
+                            1 for title in titles if topic_lower in _lower(title)
+                        )
 
-                current_date += timedelta(days=1)
+                    # 提取关键词（简单分词），每个Platform每天只调用一次 Counter.update
+                    stats["top_keywords"].update(
+                        chain.from_iterable(self._extract_keywords(title) for title in titles)
+                    )
 
             # 转换为可序列化的格式
             result_stats = {}
@@ -562,7 +608,8 @@ class AnalyticsTools:
 
             # 关键词共现statistics
             cooccurrence = Counter()
-            keyword_titles = defaultdict(list)
+            # 关键词 -> include它的title（dict 当有序集合用：自动去重、O(1) 判断、保持首次出现顺序）
+            keyword_titles = defaultdict(dict)
 
             for platform_id, titles in all_titles.items():
                 for title in titles.keys():
@@ -571,39 +618,37 @@ class AnalyticsTools:
 
                     # record每个关键词出现的title
                     for kw in keywords:
-                        keyword_titles[kw].append(title)
+                        keyword_titles[kw][title] = None
 
-                    # 计算两两共现
+                    # 计算两两共现（pair内统一sort，避免重复）
                     if len(keywords) >= 2:
-                        for i, kw1 in enumerate(keywords):
-                            for kw2 in keywords[i+1:]:
-                                # 统一sort，避免重复
-                                pair = tuple(sorted([kw1, kw2]))
-                                cooccurrence[pair] += 1
-
-            # 过滤低频共现
-            filtered_pairs = [
-                (pair, count) for pair, count in cooccurrence.items()
-                if count >= min_frequency
-            ]
+                        cooccurrence.update(
+                            (kw1, kw2) if kw1 <= kw2 else (kw2, kw1)
+                            for kw1, kw2 in combinations(keywords, 2)
+                        )
 
-            # sort并取TOP N
-            top_pairs = sorted(filtered_pairs, key=lambda x: x[1], reverse=True)[:top_n]
+            # 过滤低频共现并取TOP N（堆选择，不对全部共现对排序）
+            top_pairs = heapq.nlargest(
+                top_n,
+                ((pair, count) for pair, count in cooccurrence.items() if count >= min_frequency),
+                key=lambda x: x[1]
+            )
 
             # 构建result
             result_pairs = []
             for (kw1, kw2), count in top_pairs:
-                # 找出同时include两个关键词的title样本
-                titles_with_both = [
-                    title for title in keyword_titles[kw1]
-                    if kw2 in self._extract_keywords(title)
-                ]
+                # 找出同时include两个关键词的title样本（凑够3条即停）
+                kw2_titles = keyword_titles[kw2]
+                titles_with_both = list(islice(
+                    (title for title in keyword_titles[kw1] if title in kw2_titles),
+                    3
+                ))
 
                 result_pairs.append({
                     "keyword1": kw1,
                     "keyword2": kw2,
                     "cooccurrence_count": count,
-                    "sample_titles": titles_with_both[:3]
+                    "sample_titles": titles_with_both
                 })
 
             return {
@@ -693,44 +738,38 @@ class AnalyticsTools:
 
             # 收集newsdata（support多天）
             all_news_items = []
-            current_date = start_date
+            topic_lower = topic.lower() if topic else None
+            for current_date, day_data in self.data_service.parser.read_all_titles_for_range(
+                start_date, end_date, platform_ids=platforms
+            ):
+                if day_data is None:
+                    continue
+                all_titles, id_to_name, _ = day_data
+                date_str = current_date.strftime("%Y-%m-%d")
 
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+                # 收集该date的news
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    for title, info in titles.items():
+                        # 如果指定了话题，只收集include话题的title
+                        if topic_lower and topic_lower not in _lower(title):
+                            continue
 
-                    # 收集该date的news
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        for title, info in titles.items():
-                            # 如果指定了话题，只收集include话题的title
-                            if topic and topic.lower() not in title.lower():
-                                continue
-
-                            news_item = {
-                                "platform": platform_name,
-                                "title": title,
-                                "ranks": info.get("ranks", []),
-                                "count": len(info.get("ranks", [])),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            }
-
-                            # 条件性添加 URL 字段
-                            if include_url:
-                                news_item["url"] = info.get("url", "")
-                                news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                            all_news_items.append(news_item)
+                        news_item = {
+                            "platform": platform_name,
+                            "title": title,
+                            # 引用缓存的Parseresult：去重合并时Generate新list，不会原地修改
+                            "ranks": info.get("ranks", []),
+                            "count": len(info.get("ranks", [])),
+                            "date": date_str
+                        }
 
-                except DataNotFoundError:
-                    # 该date没有data，继续下一天
-                    pass
+                        # 条件性添加 URL 字段
+                        if include_url:
+                            news_item["url"] = info.get("url", "")
+                            news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                # 下一天
-                current_date += timedelta(days=1)
+                        all_news_items.append(news_item)
 
             if not all_news_items:
                 time_desc = "today" if start_date == end_date else f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
@@ -739,29 +778,32 @@ class AnalyticsTools:
                     suggestion="请尝试其他话题、date范围或Platform"
                 )
 
-            # 去重（同一title只保留一次）
+            # 去重（同一title只保留一次）：先按 (Platform, title) 收集各天的 ranks，最后一次性合并
             unique_news = {}
+            rank_fragments = {}
             for item in all_news_items:
-                key = f"{item['platform']}::{item['title']}"
-                if key not in unique_news:
+                key = (item["platform"], item["title"])
+                fragments = rank_fragments.get(key)
+                if fragments is None:
                     unique_news[key] = item
+                    rank_fragments[key] = [item["ranks"]]
                 else:
-                    # 合并 ranks（如果同一news在多天出现）
-                    existing = unique_news[key]
-                    existing["ranks"].extend(item["ranks"])
-                    existing["count"] = len(existing["ranks"])
+                    # 同一news在多天出现
+                    fragments.append(item["ranks"])
+
+            for key, item in unique_news.items():
+                fragments = rank_fragments[key]
+                if len(fragments) > 1:
+                    item["ranks"] = [rank for ranks in fragments for rank in ranks]
+                    item["count"] = len(item["ranks"])
 
             deduplicated_news = list(unique_news.values())
 
-            # 按权重sort（如果enabled）
+            # 按权重取前 limit 条（如果enabled）：堆选择只维护 limit 条，不对整个list排序
             if sort_by_weight:
-                deduplicated_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
-
-            # limitreturn数量
-            selected_news = deduplicated_news[:limit]
+                selected_news = heapq.nlargest(limit, deduplicated_news, key=calculate_news_weight)
+            else:
+                selected_news = deduplicated_news[:limit]
 
             # Generate AI hint词
             ai_prompt = self._create_sentiment_analysis_prompt(
@@ -1114,18 +1156,11 @@ class AnalyticsTools:
             if entity in entity_context:
                 del entity_context[entity]
 
-            # 按权重sort（如果enabled）
+            # 按权重（如果enabled）或rank取前 limit 条
             if sort_by_weight:
-                related_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                result_news = heapq.nlargest(limit, related_news, key=calculate_news_weight)
             else:
-                # 按ranksort
-                related_news.sort(key=lambda x: x["rank"])
-
-            # limitreturn数量
-            result_news = related_news[:limit]
+                result_news = heapq.nsmallest(limit, related_news, key=lambda x: x["rank"])
 
             return {
                 "success": True,
@@ -1207,32 +1242,28 @@ class AnalyticsTools:
             all_platforms_news = defaultdict(int)
             all_titles_list = []
 
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        all_platforms_news[platform_name] += len(titles)
-
-                        for title in titles.keys():
-                            all_titles_list.append({
-                                "title": title,
-                                "platform": platform_name,
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
+            for current_date, day_data in self.data_service.parser.read_all_titles_for_range(
+                start_date, end_date
+            ):
+                if day_data is None:
+                    continue
+                all_titles, id_to_name, _ = day_data
+                date_str = current_date.strftime("%Y-%m-%d")
 
-                            # 提取关键词
-                            keywords = self._extract_keywords(title)
-                            all_keywords.update(keywords)
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    all_platforms_news[platform_name] += len(titles)
 
-                except DataNotFoundError:
-                    pass
+                    for title in titles.keys():
+                        all_titles_list.append({
+                            "title": title,
+                            "platform": platform_name,
+                            "date": date_str
+                        })
 
-                current_date += timedelta(days=1)
+                        # 提取关键词
+                        keywords = self._extract_keywords(title)
+                        all_keywords.update(keywords)
 
             # Generatereport
             report_title = f"{'每日' if report_type == 'daily' else '每周'}newshot topic摘要"
@@ -1285,12 +1316,15 @@ class AnalyticsTools:
             if all_titles_list:
                 # 计算每条news的权重分数（基于关键词出现次数）
                 news_with_scores = []
+                top_keywords_lower = [
+                    (keyword.lower(), count) for keyword, count in all_keywords.most_common(10)
+                ]
                 for news in all_titles_list:
                     # 简单权重：statisticsincludeTOP关键词的次数
                     score = 0
-                    title_lower = news['title'].lower()
-                    for keyword, count in all_keywords.most_common(10):
-                        if keyword.lower() in title_lower:
+                    title_lower = _lower(news['title'])
+                    for keyword_lower, count in top_keywords_lower:
+                        if keyword_lower in title_lower:
                             score += count
                     news_with_scores.append((news, score))
 
@@ -1380,34 +1414,30 @@ class AnalyticsTools:
             })
 
             # 遍历date范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        platform_activity[platform_name]["news_count"] += len(titles)
-                        platform_activity[platform_name]["days_active"].add(current_date.strftime("%Y-%m-%d"))
+            for current_date, day_data in self.data_service.parser.read_all_titles_for_range(
+                start_date, end_date
+            ):
+                if day_data is None:
+                    continue
+                all_titles, id_to_name, timestamps = day_data
+                date_str = current_date.strftime("%Y-%m-%d")
 
-                        # statisticsUpdate次数（基于file数量）
-                        platform_activity[platform_name]["total_updates"] += len(timestamps)
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
 
-                        # statisticstime分布（基于file名中的time）
-                        for filename in timestamps.keys():
-                            # Failed to parse file名中的hour（格式：HHMM.txt）
-                            match = re.match(r'(\d{2})(\d{2})\.txt', filename)
-                            if match:
-                                hour = int(match.group(1))
-                                platform_activity[platform_name]["hourly_distribution"][hour] += 1
+                    platform_activity[platform_name]["news_count"] += len(titles)
+                    platform_activity[platform_name]["days_active"].add(date_str)
 
-                except DataNotFoundError:
-                    pass
+                    # statisticsUpdate次数（基于file数量）
+                    platform_activity[platform_name]["total_updates"] += len(timestamps)
 
-                current_date += timedelta(days=1)
+                    # statisticstime分布（基于file名中的time）
+                    for filename in timestamps.keys():
+                        # Failed to parse file名中的hour（格式：HHMM.txt）
+                        match = _FILENAME_TIME_RE.match(filename)
+                        if match:
+                            hour = int(match.group(1))
+                            platform_activity[platform_name]["hourly_distribution"][hour] += 1
 
             # 转换为可序列化的格式
             result_activity = {}
@@ -1509,32 +1539,23 @@ class AnalyticsTools:
 
             # 收集话题historydata
             lifecycle_data = []
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # statistics该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count
-                    })
-
-                except DataNotFoundError:
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0
-                    })
+            topic_lower = topic.lower()
+            for current_date, day_data in self.data_service.parser.read_all_titles_for_range(
+                start_date, end_date
+            ):
+                all_titles = day_data[0] if day_data else {}
+
+                # statistics该日的话题出现次数
+                count = 0
+                for _, titles in all_titles.items():
+                    for title in titles.keys():
+                        if topic_lower in _lower(title):
+                            count += 1
 
-                current_date += timedelta(days=1)
+                lifecycle_data.append({
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "count": count
+                })
 
             # 计算analysis天数
             total_days = (end_date - start_date).days + 1
@@ -1680,8 +1701,11 @@ class AnalyticsTools:
                     keywords = self._extract_keywords(title)
                     current_keywords.update(keywords)
 
+                    # 每个关键词只保留前3个样本title
                     for kw in keywords:
-                        current_keyword_titles[kw].append(title)
+                        samples = current_keyword_titles[kw]
+                        if len(samples) < 3:
+                            samples.append(title)
 
             # statistics之前的关键词频率
             previous_keywords = Counter()
@@ -1715,7 +1739,7 @@ class AnalyticsTools:
                         "current_count": current_count,
                         "previous_count": previous_count,
                         "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
-                        "sample_titles": current_keyword_titles[keyword][:3],
+                        "sample_titles": current_keyword_titles[keyword],
                         "alert_level": "高" if growth_rate > threshold * 2 else "中"
                     })
 
@@ -1832,8 +1856,11 @@ class AnalyticsTools:
                         keywords = self._extract_keywords(title)
                         keywords_count.update(keywords)
 
+                        # 每个关键词只保留前3个样本title
                         for kw in keywords:
-                            keyword_titles[kw].append(title)
+                            samples = keyword_titles[kw]
+                            if len(samples) < 3:
+                                samples.append(title)
 
                 for keyword, count in keywords_count.items():
                     keyword_trends[keyword].append(count)
@@ -1885,7 +1912,7 @@ class AnalyticsTools:
                             "confidence": round(confidence, 2),
                             "trend_data": trend_data,
                             "prediction": "上升趋势，可能成为hot topic",
-                            "sample_titles": keyword_titles.get(keyword, [])[:3]
+                            "sample_titles": keyword_titles.get(keyword, [])
                         })
 
             # 按置信度和增长率sort
@@ -1920,7 +1947,7 @@ class AnalyticsTools:
 
     # ==================== 辅助方法 ====================
 
-    def _extract_keywords(self, title: str, min_length: int = 2) -> List[str]:
+    def _extract_keywords(self, title: str, min_length: int = 2) -> Tuple[str, ...]:
         """
         从title中提取关键词（简单实现）
 
@@ -1929,24 +1956,9 @@ class AnalyticsTools:
             min_length: 最小关键词长度
 
         Returns:
-            关键词list
+            关键词元组（按title缓存，多个analysis工具、多天之间共享，调用方不得修改）
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'[^\w\s]', ' ', title)
-
-        # 简单分词（按空格和常见分隔符）
-        words = re.split(r'[\s，。！？、]+', title)
-
-        # 过滤停用词和短词
-        stopwords = {'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'}
-
-        keywords = [
-            word.strip() for word in words
-            if word.strip() and len(word.strip()) >= min_length and word.strip() not in stopwords
-        ]
-
-        return keywords
+        return _title_keywords(title, min_length)
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """